@@ -24,6 +24,18 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 DEFAULT_GEMINI_MODEL = "models/gemini-2.0-flash"
 
 
+# genai holds one process-wide API key; remember which key it was last given so
+# cached providers can tell when another key has been configured since
+_configured_api_key: str | None = None
+
+
+def _configure(api_key: str) -> None:
+    """Sets the process-wide genai API key."""
+    global _configured_api_key
+    genai.configure(api_key=api_key)
+    _configured_api_key = api_key
+
+
 def list_gemini_models(api_key: str) -> list[str]:
     """
     List all available Gemini models that support content generation.
@@ -35,7 +47,7 @@ def list_gemini_models(api_key: str) -> list[str]:
         List of model names.
     """
     try:
-        genai.configure(api_key=api_key)
+        _configure(api_key)
         models = genai.list_models()
         return [
             model.name
@@ -71,7 +83,7 @@ class GeminiProvider(AIProvider):
         if not self._model_name.startswith("models/"):
             self._model_name = f"models/{self._model_name}"
 
-        genai.configure(api_key=api_key)
+        _configure(api_key)
         self._model = genai.GenerativeModel(self._model_name)
 
         # Load JSON schemas
@@ -90,6 +102,13 @@ class GeminiProvider(AIProvider):
             logging.error(f"Error decoding schema {schema_path}: {e}")
             return None
 
+    def _ensure_configured(self) -> None:
+        """Points genai back at this provider's API key if another key was set since."""
+        if _configured_api_key != self.api_key:
+            _configure(self.api_key)
+            # The model keeps the clients it built with the previous key
+            self._model = genai.GenerativeModel(self._model_name)
+
     @property
     def provider_name(self) -> str:
         return "gemini"
@@ -152,6 +171,7 @@ class GeminiProvider(AIProvider):
 
         try:
             logging.info(f"Categorizing {len(posts)} posts with Gemini API ({self._model_name})...")
+            self._ensure_configured()
 
             response = await async_retry(self._model.generate_content_async)(
                 prompt_text, generation_config=generation_config
@@ -299,6 +319,7 @@ class GeminiProvider(AIProvider):
             logging.info(
                 f"Analyzing {len(comments)} comments with Gemini API ({self._model_name})..."
             )
+            self._ensure_configured()
 
             response = retry_policy(self._model.generate_content)(
                 prompt_text, generation_config=generation_config
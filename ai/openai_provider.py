@@ -5,6 +5,7 @@ This module implements the AIProvider interface for OpenAI-compatible APIs,
 supporting custom base URLs for providers like Ollama, LM Studio, OpenRouter, etc.
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -21,6 +22,9 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # Default OpenAI settings
 DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
+# Rate-limit, 5xx and connection errors are retried by the client with exponential
+# backoff; the SDK default of 2 retries gives up long before Gemini's retry policy
+OPENAI_MAX_RETRIES = 5
 
 
 def list_openai_models(base_url: str, api_key: str) -> list[str]:
@@ -69,7 +73,9 @@ class OpenAIProvider(AIProvider):
         self.base_url = base_url or DEFAULT_OPENAI_BASE_URL
         self._model_name = model or DEFAULT_OPENAI_MODEL
 
-        self.client = OpenAI(base_url=self.base_url, api_key=api_key)
+        self.client = OpenAI(
+            base_url=self.base_url, api_key=api_key, max_retries=OPENAI_MAX_RETRIES
+        )
 
     @property
     def provider_name(self) -> str:
@@ -130,8 +136,8 @@ class OpenAIProvider(AIProvider):
         """
         Analyze a batch of posts using OpenAI-compatible API.
 
-        Note: This method is synchronous despite being async, as the openai
-        library handles async internally.
+        The blocking API call runs in a worker thread, so several batches can be
+        in flight at once.
 
         Args:
             posts: List of post dictionaries.
@@ -162,7 +168,8 @@ class OpenAIProvider(AIProvider):
                 f"Categorizing {len(posts)} posts with OpenAI-compatible API ({self._model_name})..."
             )
 
-            response = self.client.chat.completions.create(
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self._model_name,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -177,7 +184,7 @@ class OpenAIProvider(AIProvider):
                 return []
 
             content = response.choices[0].message.content
-            logging.debug(f"Raw response: {content[:500] if content else 'None'}...")
+            logging.debug("Raw response: %s...", content[:500] if content else "None")
 
             # Handle response that might be wrapped in an object
             try:
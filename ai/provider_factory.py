@@ -12,6 +12,11 @@ from ai.base_provider import AIProvider
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Providers already built in this process, keyed by their resolved settings, so the
+# interactive menu reuses clients and loaded schemas across process-ai runs. Gemini's
+# API key is process-wide, so GeminiProvider re-applies its own key before each request.
+_providers: dict[tuple, AIProvider] = {}
+
 
 def get_ai_provider(
     provider_type: str | None = None, model: str | None = None, **kwargs
@@ -19,6 +24,9 @@ def get_ai_provider(
     """
     Factory function to get the appropriate AI provider based on configuration.
 
+    Providers are cached per provider, model and credentials, so repeated calls with
+    the same settings return the same instance.
+
     Args:
         provider_type: Type of provider ('gemini' or 'openai').
                       If None, uses AI_PROVIDER from config.
@@ -62,7 +70,10 @@ def _create_gemini_provider(model: str | None = None, **kwargs) -> AIProvider:
     api_key = kwargs.get("api_key") or get_google_api_key()
     model_name = model or get_gemini_model()
 
-    return GeminiProvider(api_key=api_key, model=model_name)
+    key = ("gemini", api_key, model_name)
+    if key not in _providers:
+        _providers[key] = GeminiProvider(api_key=api_key, model=model_name)
+    return _providers[key]
 
 
 def _create_openai_provider(model: str | None = None, **kwargs) -> AIProvider:
@@ -74,7 +85,10 @@ def _create_openai_provider(model: str | None = None, **kwargs) -> AIProvider:
     base_url = kwargs.get("base_url") or get_openai_base_url()
     model_name = model or get_openai_model()
 
-    return OpenAIProvider(api_key=api_key, base_url=base_url, model=model_name)
+    key = ("openai", api_key, base_url, model_name)
+    if key not in _providers:
+        _providers[key] = OpenAIProvider(api_key=api_key, base_url=base_url, model=model_name)
+    return _providers[key]
 
 
 def list_available_providers() -> list:
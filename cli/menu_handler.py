@@ -4,10 +4,10 @@ Handles both interactive menu and command-line argument modes.
 """
 
 import argparse
-import asyncio
 import getpass
 import os
 import re
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -784,7 +784,7 @@ def handle_settings_menu():
         get_env_file_path,
         has_facebook_credentials,
         has_google_api_key,
-        save_credential_to_env,
+        save_credentials_to_env,
     )
 
     while True:
@@ -818,27 +818,14 @@ def handle_settings_menu():
             break
 
         if choice == "1":
-            print("\nGet your API key from: https://aistudio.google.com/apikey")
-            try:
-                api_key = getpass.getpass("Enter new Google API Key: ").strip()
-                if api_key:
-                    if save_credential_to_env("GOOGLE_API_KEY", api_key):
-                        print("  API key updated!")
-                    else:
-                        print("  Failed to save API key.")
-                else:
-                    print("  No API key entered, skipping.")
-            except (EOFError, KeyboardInterrupt):
-                print("\n  Cancelled.")
+            handle_update_google_api_key()
 
         elif choice == "2":
             try:
                 username = input("Enter Facebook Email/Username: ").strip()
                 password = getpass.getpass("Enter Facebook Password: ")
                 if username and password:
-                    saved_user = save_credential_to_env("FB_USER", username)
-                    saved_pass = save_credential_to_env("FB_PASS", password)
-                    if saved_user and saved_pass:
+                    if save_credentials_to_env({"FB_USER": username, "FB_PASS": password}):
                         print("  Credentials updated!")
                     else:
                         print("  Failed to save credentials.")
@@ -874,9 +861,80 @@ def handle_settings_menu():
             print("  Invalid choice. Please enter 0-5.")
 
 
+_CLEAR_COMMAND = "cls" if os.name == "nt" else "clear"
+
+
 def clear_screen():
     """Clears the terminal screen."""
-    os.system("cls" if os.name == "nt" else "clear")
+    os.system(_CLEAR_COMMAND)
+
+
+def _run_scrape(args, command_handlers):
+    """Runs the scrape command from parsed arguments."""
+    # Validate URL if provided via CLI
+    if args.group_url and not validate_facebook_url(args.group_url):
+        print("Error: Invalid Facebook group URL provided.")
+        return
+    command_handlers["scrape"](args.group_url, args.group_id, args.num_posts, args.headless)
+
+
+def _run_process_ai(args, command_handlers):
+    """Runs the process-ai command from parsed arguments."""
+    import asyncio
+
+    asyncio.run(command_handlers["process_ai"](args.group_id))
+
+
+def _run_view(args, command_handlers):
+    """Runs the view command from parsed arguments."""
+    filters = {
+        "category": args.category,
+        "start_date": args.start_date,
+        "end_date": args.end_date,
+        "post_author": args.post_author,
+        "comment_author": args.comment_author,
+        "keyword": args.keyword,
+        "min_comments": args.min_comments,
+        "max_comments": args.max_comments,
+        "is_idea": args.is_idea,
+    }
+    command_handlers["view"](args.group_id, filters, args.limit)
+
+
+def _run_export(args, command_handlers):
+    """Runs the export-data command from parsed arguments."""
+    command_handlers["export"](args)
+
+
+def _run_add_group(args, command_handlers):
+    """Runs the add-group command from parsed arguments."""
+    # Validate URL for add-group command
+    if not validate_facebook_url(args.url):
+        print("Error: Invalid Facebook group URL provided.")
+        return
+    command_handlers["add_group"](args.name, args.url)
+
+
+def _run_list_groups(args, command_handlers):
+    """Runs the list-groups command."""
+    command_handlers["list_groups"]()
+
+
+def _run_remove_group(args, command_handlers):
+    """Runs the remove-group command from parsed arguments."""
+    command_handlers["remove_group"](args.id)
+
+
+def _run_stats(args, command_handlers):
+    """Runs the stats command."""
+    command_handlers["stats"]()
+
+
+def _run_setup(args, command_handlers):
+    """Runs the setup wizard."""
+    from config import run_setup_wizard
+
+    run_setup_wizard()
 
 
 def create_arg_parser():
@@ -901,6 +959,7 @@ def create_arg_parser():
         action="store_true",
         help="Run the browser in headless mode (no GUI).",
     )
+    scrape_parser.set_defaults(func=_run_scrape)
 
     process_ai_parser = subparsers.add_parser(
         "process-ai",
@@ -909,6 +968,7 @@ def create_arg_parser():
     process_ai_parser.add_argument(
         "--group-id", type=int, help="Only process posts from this group ID."
     )
+    process_ai_parser.set_defaults(func=_run_process_ai)
 
     view_parser = subparsers.add_parser("view", help="Display posts from the database.")
     view_parser.add_argument("--group-id", type=int, help="Only show posts from this group ID.")
@@ -928,15 +988,16 @@ def create_arg_parser():
         help="Filter for posts marked as potential ideas.",
     )
     view_parser.add_argument("--limit", type=int, help="Limit the number of posts to display")
+    view_parser.set_defaults(func=_run_view)
 
     export_parser = subparsers.add_parser(
-        "export-data", help="Export data (posts or comments) to CSV or JSON file."
+        "export-data", help="Export data (posts or comments) to CSV, JSON or Parquet file."
     )
     export_parser.add_argument(
         "--format",
         required=True,
-        choices=["csv", "json"],
-        help="Output format: csv or json.",
+        choices=["csv", "json", "parquet"],
+        help="Output format: csv, json or parquet (parquet requires pyarrow).",
     )
     export_parser.add_argument("--output", required=True, help="Output file path.")
     export_parser.add_argument(
@@ -960,12 +1021,27 @@ def create_arg_parser():
         action="store_true",
         help="Filter for posts marked as potential ideas.",
     )
+    export_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output for readability (default: compact).",
+    )
+    export_parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help="Refresh database statistics (ANALYZE) before exporting.",
+    )
+    export_parser.set_defaults(func=_run_export)
 
     add_group_parser = subparsers.add_parser("add-group", help="Add a new Facebook group to track.")
     add_group_parser.add_argument("--name", required=True, help="Name of the Facebook group.")
     add_group_parser.add_argument("--url", required=True, help="URL of the Facebook group.")
+    add_group_parser.set_defaults(func=_run_add_group)
 
-    subparsers.add_parser("list-groups", help="List all tracked Facebook groups.")
+    list_groups_parser = subparsers.add_parser(
+        "list-groups", help="List all tracked Facebook groups."
+    )
+    list_groups_parser.set_defaults(func=_run_list_groups)
 
     remove_group_parser = subparsers.add_parser(
         "remove-group", help="Remove a Facebook group from tracking."
@@ -973,12 +1049,17 @@ def create_arg_parser():
     remove_group_parser.add_argument(
         "--id", type=int, required=True, help="ID of the group to remove."
     )
+    remove_group_parser.set_defaults(func=_run_remove_group)
 
-    subparsers.add_parser(
+    stats_parser = subparsers.add_parser(
         "stats", help="Display summary statistics about the data in the database."
     )
+    stats_parser.set_defaults(func=_run_stats)
 
-    subparsers.add_parser("setup", help="Run the setup wizard to configure credentials.")
+    setup_parser = subparsers.add_parser(
+        "setup", help="Run the setup wizard to configure credentials."
+    )
+    setup_parser.set_defaults(func=_run_setup)
 
     return parser
 
@@ -1067,6 +1148,8 @@ def run_interactive_menu(command_handlers):
                         input("\nPress Enter to continue...")
                         continue
 
+                import asyncio
+
                 asyncio.run(command_handlers["process_ai"]())
             except KeyboardInterrupt:
                 print("\nOperation cancelled by user.")
@@ -1178,9 +1261,9 @@ def run_interactive_menu(command_handlers):
                         print("Invalid group ID. Must be a positive number.")
 
                 elif sub_choice == "4":
-                    format_choice = input("Choose format (csv/json): ").strip().lower()
-                    if format_choice not in ["csv", "json"]:
-                        print("Invalid format. Must be 'csv' or 'json'")
+                    format_choice = input("Choose format (csv/json/parquet): ").strip().lower()
+                    if format_choice not in ["csv", "json", "parquet"]:
+                        print("Invalid format. Must be 'csv', 'json' or 'parquet'")
                     else:
                         print("\nOutput File Path Guidelines:")
                         print("- For Windows: Use any of these formats:")
@@ -1214,6 +1297,8 @@ def run_interactive_menu(command_handlers):
                                     "min_comments": None,
                                     "max_comments": None,
                                     "is_idea": False,
+                                    "pretty": True,
+                                    "analyze": False,
                                 },
                             )()
                             command_handlers["export"](args)
@@ -1251,48 +1336,9 @@ def handle_cli_arguments(args, command_handlers):
         command_handlers: Dict mapping command names to their handler functions
     """
     try:
+        # Each subcommand registers its runner with set_defaults(func=...)
         if args.command:
-            if args.command == "scrape":
-                # Validate URL if provided via CLI
-                if args.group_url and not validate_facebook_url(args.group_url):
-                    print("Error: Invalid Facebook group URL provided.")
-                    return
-                command_handlers["scrape"](
-                    args.group_url, args.group_id, args.num_posts, args.headless
-                )
-            elif args.command == "process-ai":
-                asyncio.run(command_handlers["process_ai"](args.group_id))
-            elif args.command == "view":
-                filters = {
-                    "category": args.category,
-                    "start_date": args.start_date,
-                    "end_date": args.end_date,
-                    "post_author": args.post_author,
-                    "comment_author": args.comment_author,
-                    "keyword": args.keyword,
-                    "min_comments": args.min_comments,
-                    "max_comments": args.max_comments,
-                    "is_idea": args.is_idea,
-                }
-                command_handlers["view"](args.group_id, filters, args.limit)
-            elif args.command == "export-data":
-                command_handlers["export"](args)
-            elif args.command == "add-group":
-                # Validate URL for add-group command
-                if not validate_facebook_url(args.url):
-                    print("Error: Invalid Facebook group URL provided.")
-                    return
-                command_handlers["add_group"](args.name, args.url)
-            elif args.command == "list-groups":
-                command_handlers["list_groups"]()
-            elif args.command == "remove-group":
-                command_handlers["remove_group"](args.id)
-            elif args.command == "stats":
-                command_handlers["stats"]()
-            elif args.command == "setup":
-                from config import run_setup_wizard
-
-                run_setup_wizard()
+            args.func(args, command_handlers)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
     except Exception as e:
@@ -1316,6 +1362,11 @@ def run_cli(command_handlers):
             - 'remove_group': Function to handle removing groups
             - 'stats': Function to handle statistics display
     """
+    # Without arguments there is nothing to parse, so skip building the parser
+    if len(sys.argv) == 1:
+        run_interactive_menu(command_handlers)
+        return
+
     parser = create_arg_parser()
     args = parser.parse_args()
 
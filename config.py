@@ -1,19 +1,24 @@
+import functools
 import getpass
 import logging
 import os
+import re
+import shutil
 import sys
 
-from dotenv import load_dotenv
-
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 # --- Platform-Appropriate Data Directory ---
 
 
+@functools.cache
 def get_app_data_dir() -> str:
     r"""
     Get the platform-appropriate application data directory.
 
+    The result is cached, since the platform and home directory lookups
+    cannot change for the lifetime of the process.
+
     Returns:
         - Windows: %APPDATA%\FBScrapeIdeas\
         - macOS: ~/Library/Application Support/FBScrapeIdeas/
@@ -32,9 +37,12 @@ def get_app_data_dir() -> str:
     return app_dir
 
 
+_IS_FROZEN = getattr(sys, "frozen", False)
+
+
 def is_frozen() -> bool:
     """Check if running as a frozen executable (PyInstaller, cx_Freeze, etc.)."""
-    return getattr(sys, "frozen", False)
+    return _IS_FROZEN
 
 
 def get_env_file_path() -> str:
@@ -92,18 +100,77 @@ def get_db_path(db_name: str = "insights.db") -> str:
         return local_db
 
 
+# --- Cached Environment Lookups ---
+
+_env_cache: dict[str, str] = {}
+
+
+def _cached_getenv(key: str) -> str | None:
+    """
+    Return os.getenv(key), memoized for the lifetime of the process.
+
+    Only values that were found are cached, so a variable set later in the run is
+    still picked up. Entries are refreshed by save_credential_to_env when a value
+    changes and dropped whenever the .env file is reloaded.
+    """
+    value = _env_cache.get(key)
+    if value is None:
+        value = os.getenv(key)
+        if value:
+            _env_cache[key] = value
+    return value
+
+
 # --- Load .env from appropriate location ---
 _env_path = get_env_file_path()
-if os.path.exists(_env_path):
-    load_dotenv(_env_path)
-    logging.info(f"Loaded environment from: {_env_path}")
-else:
-    # Try loading from default locations (CWD, etc.)
-    load_dotenv()
+_env_mtime: float | None = None
+
+
+def load_env_file() -> None:
+    """
+    Load the .env file into the environment.
+
+    The file's mtime is remembered, so repeated calls skip re-parsing an unchanged file.
+    """
+    global _env_mtime
+
+    try:
+        mtime = os.stat(_env_path).st_mtime
+    except OSError:
+        mtime = None
+
+    if mtime is not None and mtime == _env_mtime:
+        return
+
+    from dotenv import load_dotenv
+
+    if mtime is not None:
+        load_dotenv(_env_path)
+        logging.info("Loaded environment from: %s", _env_path)
+    else:
+        # Try loading from default locations (CWD, etc.)
+        load_dotenv()
+
+    _env_mtime = mtime
+    _env_cache.clear()
+
+
+load_env_file()
 
 
 # --- Credential Saving ---
 
+_KEY_RE_CACHE: dict[str, re.Pattern] = {}
+
+
+def _get_key_pattern(key: str) -> re.Pattern:
+    """Get the compiled pattern matching `KEY=value` lines (KEY = value, indented, etc.)."""
+    pattern = _KEY_RE_CACHE.get(key)
+    if pattern is None:
+        pattern = re.compile(rf"^[ \t]*{re.escape(key)}[ \t]*=(.*)$", re.MULTILINE)
+        _KEY_RE_CACHE[key] = pattern
+    return pattern
+
 
 def save_credential_to_env(key: str, value: str) -> bool:
     """
@@ -116,7 +183,21 @@ def save_credential_to_env(key: str, value: str) -> bool:
     Returns:
         True if saved successfully, False otherwise
     """
+    return save_credentials_to_env({key: value})
+
+
+def save_credentials_to_env(credentials: dict[str, str]) -> bool:
+    """
+    Save or update several credentials in the .env file with a single rewrite.
+
+    Args:
+        credentials: Mapping of environment variable names to the values to save
+
+    Returns:
+        True if all credentials were saved successfully, False otherwise
+    """
     env_path = get_env_file_path()
+    keys = ", ".join(credentials)
 
     # Ensure directory exists
     env_dir = os.path.dirname(env_path)
@@ -124,46 +205,67 @@ def save_credential_to_env(key: str, value: str) -> bool:
         try:
             os.makedirs(env_dir, exist_ok=True)
         except OSError as e:
-            logging.error(f"Failed to create directory {env_dir}: {e}")
+            logging.error("Failed to create directory %s: %s", env_dir, e)
             return False
 
     try:
         # Read existing content
-        existing_lines = []
+        content = ""
         if os.path.exists(env_path):
             with open(env_path, encoding="utf-8") as f:
-                existing_lines = f.readlines()
-
-        # Update or add the key
-        key_found = False
-        new_lines = []
-        for line in existing_lines:
-            stripped = line.strip()
-            # Check if this line defines our key (handle KEY=value, KEY = value, etc.)
-            if stripped.startswith(f"{key}=") or stripped.startswith(f"{key} ="):
-                new_lines.append(f"{key}={value}\n")
-                key_found = True
-            else:
-                new_lines.append(line)
-
-        if not key_found:
-            # Add newline before new key if file doesn't end with one
-            if new_lines and not new_lines[-1].endswith("\n"):
-                new_lines.append("\n")
-            new_lines.append(f"{key}={value}\n")
-
-        # Write back
-        with open(env_path, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+                content = f.read()
+
+        changed = {}
+        for key, value in credentials.items():
+            # Nothing to do if the file and the environment already hold this value
+            pattern = _get_key_pattern(key)
+            existing_values = pattern.findall(content)
+            if (
+                existing_values
+                and all(existing.strip() == value for existing in existing_values)
+                and os.environ.get(key) == value
+            ):
+                _env_cache[key] = value
+                continue
+
+            # Update every line defining our key in one pass, or append it if missing
+            new_line = f"{key}={value}"
+            content, replaced = pattern.subn(lambda _match, line=new_line: line, content)
+            if not replaced:
+                # Add newline before new key if file doesn't end with one
+                if content and not content.endswith("\n"):
+                    content += "\n"
+                content += f"{new_line}\n"
+            changed[key] = value
+
+        if not changed:
+            logging.info("%s unchanged in %s, skipping write", keys, env_path)
+            return True
+
+        # Write to a temp file and swap it in atomically so a crash never leaves a torn .env.
+        # The content is encoded once and written straight to the descriptor; new files are
+        # created owner-only since they hold credentials.
+        tmp_path = f"{env_path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            data = memoryview(content.encode("utf-8"))
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+        if os.path.exists(env_path):
+            shutil.copymode(env_path, tmp_path)
+        os.replace(tmp_path, env_path)
 
         # Also set in current environment
-        os.environ[key] = value
+        os.environ.update(changed)
+        _env_cache.update(changed)
 
-        logging.info(f"Saved {key} to {env_path}")
+        logging.info("Saved %s to %s", ", ".join(changed), env_path)
         return True
 
     except Exception as e:
-        logging.error(f"Failed to save credential {key}: {e}")
+        logging.error("Failed to save credentials %s: %s", keys, e)
         return False
 
 
@@ -179,16 +281,29 @@ def delete_env_file() -> bool:
     try:
         if os.path.exists(env_path):
             os.remove(env_path)
-            logging.info(f"Deleted credentials file: {env_path}")
+            logging.info("Deleted credentials file: %s", env_path)
         return True
     except Exception as e:
-        logging.error(f"Failed to delete credentials file: {e}")
+        logging.error("Failed to delete credentials file: %s", e)
         return False
 
 
 # --- Credential Retrieval with Prompting ---
 
 
+def _offer_to_save_api_key(key: str, api_key: str) -> None:
+    """Ask whether a freshly entered API key should be saved to the .env file."""
+    try:
+        save = input("Save API key for future sessions? (y/n): ").lower().strip()
+        if save == "y":
+            if save_credential_to_env(key, api_key):
+                print("  API key saved!")
+            else:
+                print("  Warning: Failed to save API key. It will need to be re-entered next time.")
+    except (EOFError, KeyboardInterrupt):
+        print("\n  Skipping save.")
+
+
 def get_google_api_key() -> str:
     """
     Gets the Google API key from environment variables or prompts the user.
@@ -199,7 +314,7 @@ def get_google_api_key() -> str:
     Raises:
         ValueError: If no API key is provided
     """
-    api_key = os.getenv("GOOGLE_API_KEY")
+    api_key = _cached_getenv("GOOGLE_API_KEY")
 
     if api_key:
         logging.info("Loading Google API key from environment variables.")
@@ -221,17 +336,7 @@ def get_google_api_key() -> str:
     if not api_key:
         raise ValueError("Google API key is required for AI features.")
 
-    # Offer to save
-    try:
-        save = input("Save API key for future sessions? (y/n): ").lower().strip()
-        if save == "y":
-            if save_credential_to_env("GOOGLE_API_KEY", api_key):
-                print("  API key saved!")
-            else:
-                print("  Warning: Failed to save API key. It will need to be re-entered next time.")
-    except (EOFError, KeyboardInterrupt):
-        print("\n  Skipping save.")
-
+    _offer_to_save_api_key("GOOGLE_API_KEY", api_key)
     return api_key
 
 
@@ -247,8 +352,8 @@ def get_facebook_credentials() -> tuple[str, str]:
     Raises:
         ValueError: If credentials are empty or not provided
     """
-    fb_user = os.getenv("FB_USER")
-    fb_pass = os.getenv("FB_PASS")
+    fb_user = _cached_getenv("FB_USER")
+    fb_pass = _cached_getenv("FB_PASS")
 
     if fb_user and fb_pass:
         logging.info("Loading Facebook credentials from environment variables.")
@@ -274,9 +379,7 @@ def get_facebook_credentials() -> tuple[str, str]:
     try:
         save = input("Save credentials for future sessions? (y/n): ").lower().strip()
         if save == "y":
-            saved_user = save_credential_to_env("FB_USER", username)
-            saved_pass = save_credential_to_env("FB_PASS", password)
-            if saved_user and saved_pass:
+            if save_credentials_to_env({"FB_USER": username, "FB_PASS": password}):
                 print("  Credentials saved!")
             else:
                 print(
@@ -304,12 +407,12 @@ def is_first_run() -> bool:
 
 def has_google_api_key() -> bool:
     """Check if Google API key is configured."""
-    return bool(os.getenv("GOOGLE_API_KEY"))
+    return bool(_cached_getenv("GOOGLE_API_KEY"))
 
 
 def has_facebook_credentials() -> bool:
     """Check if Facebook credentials are configured."""
-    return bool(os.getenv("FB_USER") and os.getenv("FB_PASS"))
+    return bool(_cached_getenv("FB_USER") and _cached_getenv("FB_PASS"))
 
 
 # --- AI Provider Configuration ---
@@ -319,6 +422,8 @@ DEFAULT_AI_PROVIDER = "gemini"
 DEFAULT_GEMINI_MODEL = "models/gemini-2.0-flash"
 DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
+DEFAULT_AI_MAX_CONCURRENT_BATCHES = 8
+DEFAULT_AI_COMMENT_BATCH_SIZE = 10
 
 
 def get_ai_provider_type() -> str:
@@ -365,7 +470,7 @@ def get_openai_api_key() -> str:
     Raises:
         ValueError: If no API key is provided
     """
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = _cached_getenv("OPENAI_API_KEY")
 
     if api_key:
         logging.info("Loading OpenAI API key from environment variables.")
@@ -393,17 +498,7 @@ def get_openai_api_key() -> str:
     if not api_key:
         raise ValueError("OpenAI API key is required for AI features.")
 
-    # Offer to save
-    try:
-        save = input("Save API key for future sessions? (y/n): ").lower().strip()
-        if save == "y":
-            if save_credential_to_env("OPENAI_API_KEY", api_key):
-                print("  API key saved!")
-            else:
-                print("  Warning: Failed to save API key. It will need to be re-entered next time.")
-    except (EOFError, KeyboardInterrupt):
-        print("\n  Skipping save.")
-
+    _offer_to_save_api_key("OPENAI_API_KEY", api_key)
     return api_key
 
 
@@ -417,9 +512,41 @@ def get_openai_model() -> str:
     return os.getenv("OPENAI_MODEL", DEFAULT_OPENAI_MODEL)
 
 
+def _get_positive_int_env(key: str, default: int) -> int:
+    """Read a positive integer setting from the environment, falling back to default."""
+    value = os.getenv(key)
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.warning("Invalid %s value %r, using %s", key, value, default)
+        return default
+
+
+def get_ai_max_concurrent_batches() -> int:
+    """
+    Get how many AI batches may be sent to the provider at the same time.
+
+    Returns:
+        Maximum number of in-flight batches (at least 1)
+    """
+    return _get_positive_int_env("AI_MAX_CONCURRENT_BATCHES", DEFAULT_AI_MAX_CONCURRENT_BATCHES)
+
+
+def get_ai_comment_batch_size() -> int:
+    """
+    Get how many comments are sent to the AI provider per request.
+
+    Returns:
+        Number of comments per batch (at least 1)
+    """
+    return _get_positive_int_env("AI_COMMENT_BATCH_SIZE", DEFAULT_AI_COMMENT_BATCH_SIZE)
+
+
 def has_openai_api_key() -> bool:
     """Check if OpenAI API key is configured (or using local provider)."""
-    if os.getenv("OPENAI_API_KEY"):
+    if _cached_getenv("OPENAI_API_KEY"):
         return True
     # Local providers don't need a key
     base_url = get_openai_base_url()
@@ -459,9 +586,7 @@ def run_setup_wizard() -> None:
             username = input("    Email/Username: ").strip()
             password = getpass.getpass("    Password: ")
             if username and password:
-                saved_user = save_credential_to_env("FB_USER", username)
-                saved_pass = save_credential_to_env("FB_PASS", password)
-                if saved_user and saved_pass:
+                if save_credentials_to_env({"FB_USER": username, "FB_PASS": password}):
                     print("    Saved!")
                 else:
                     print("    Warning: Failed to save credentials.")
@@ -1,47 +1,260 @@
-import json
+import atexit
 import logging
+import queue
 import sqlite3
 import time
+from collections.abc import Iterator, Sequence
 from typing import Union
 
+import orjson
+import zstandard
+
+from database.db_setup import CONNECTION_PRAGMAS_SQL, get_db_path
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 ALLOWED_FILTER_FIELDS = {"ai_category", "post_author_name", "ai_is_potential_idea"}
+COMMENT_BATCH_SIZE = 500
+# Raw AI responses are repetitive JSON; level 6 trades little CPU for a good ratio
+ZSTD_LEVEL = 6
+POST_COLUMNS = (
+    "internal_post_id",
+    "group_id",
+    "facebook_post_id",
+    "post_url",
+    "post_content_raw",
+    "post_author_name",
+    "post_author_profile_pic_url",
+    "post_image_url",
+    "posted_at",
+    "scraped_at",
+    "ai_category",
+    "ai_sub_category",
+    "ai_keywords",
+    "ai_summary",
+    "ai_is_potential_idea",
+    "ai_reasoning",
+    "ai_raw_response",
+    "ai_raw_response_zstd",
+    "is_processed_by_ai",
+    "last_ai_processing_at",
+)
+# One writer plus a few readers is all SQLite's single-writer model can use
+DB_POOL_SIZE = 5
+
+# Idle, already configured connections keyed by database path
+_pools: dict[str, queue.LifoQueue] = {}
+
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that remembers which pool it belongs to."""
+
+    pool_key: str | None = None
+
+
+def _dumps(obj) -> str:
+    """Serializes obj to JSON text for storage in a TEXT column."""
+    return orjson.dumps(obj).decode()
+
+
+def _keyword_list(keywords) -> list:
+    """
+    Normalizes AI keywords to a list of strings.
 
+    Providers hand keywords over either as a list or as JSON text, and older rows
+    stored that JSON text encoded a second time, so strings are decoded until a
+    list comes out.
 
-def _get_db_path(db_name: str = "insights.db") -> str:
+    Args:
+        keywords: A list, JSON text, or None.
+
+    Returns:
+        The keywords as a list (empty when they are missing or malformed).
     """
-    Get the database path using the centralized config function.
-    Falls back to local db_name if config is not available.
+    while isinstance(keywords, str):
+        try:
+            keywords = orjson.loads(keywords)
+        except orjson.JSONDecodeError:
+            return []
+    if not isinstance(keywords, list):
+        return []
+    return [str(keyword) for keyword in keywords]
+
+
+def _compress(text: str) -> bytes:
+    """Compresses JSON text for the ai_raw_response_zstd BLOB column."""
+    return zstandard.compress(text.encode(), ZSTD_LEVEL)
+
+
+def _decompress(blob: bytes) -> str:
+    """Restores JSON text from the ai_raw_response_zstd column."""
+    return zstandard.decompress(blob).decode()
+
+
+_UNPARSED = object()
+
+
+class LazyJSON:
     """
-    try:
-        from config import get_db_path as config_get_db_path
+    JSON text from a TEXT column that is only parsed when first accessed.
+
+    Text that is not valid JSON is returned as-is, matching the eager behavior.
+    """
+
+    __slots__ = ("_text", "_value", "_compressed")
+
+    def __init__(self, text: str | bytes, compressed: bool = False):
+        self._text = text
+        self._value = _UNPARSED
+        self._compressed = compressed
+
+    def value(self):
+        """Returns the parsed JSON value, decoding it on first use."""
+        if self._value is _UNPARSED:
+            if self._compressed:
+                self._text = _decompress(self._text)
+                self._compressed = False
+            try:
+                self._value = orjson.loads(self._text) if self._text is not None else None
+            except orjson.JSONDecodeError:
+                logging.warning("Could not parse lazily loaded JSON column")
+                self._value = self._text
+        return self._value
+
+    def __getitem__(self, key):
+        return self.value()[key]
+
+    def __iter__(self):
+        return iter(self.value())
 
-        return config_get_db_path(db_name)
-    except ImportError:
-        # Fallback if config module not available
-        return db_name
+    def __str__(self) -> str:
+        return str(self.value())
+
+    def __repr__(self) -> str:
+        return repr(self.value())
+
+
+def _dict_rows(cursor: sqlite3.Cursor) -> Iterator[dict]:
+    """
+    Yields the rows of an executed cursor as dicts.
+
+    The cursor should have its row_factory disabled: the column names are read once
+    and zipped onto each plain tuple, so no sqlite3.Row is built per row.
+    """
+    columns = [description[0] for description in cursor.description]
+    for row in cursor:
+        yield dict(zip(columns, row, strict=True))
 
 
 def get_db_connection(db_name="insights.db"):
     """
-    Creates and returns a connection to the SQLite database.
+    Returns a connection to the SQLite database, reusing a pooled one when available.
     Uses the platform-appropriate data directory via config.
+
+    Hand the connection back with release_db_connection() when done so it can be reused.
     """
-    db_path = _get_db_path(db_name)
+    db_path = get_db_path(db_name)
+
+    pool = _pools.get(db_path)
+    if pool is not None:
+        try:
+            return pool.get_nowait()
+        except queue.Empty:
+            pass
 
     try:
-        conn = sqlite3.connect(db_path)
+        # A larger statement cache keeps the repeated CRUD statements prepared;
+        # pooled connections may be picked up by a different thread than the one
+        # that opened them, but are only ever used by one thread at a time
+        conn = sqlite3.connect(
+            db_path,
+            cached_statements=256,
+            check_same_thread=False,
+            factory=_PooledConnection,
+        )
         conn.row_factory = sqlite3.Row
-        # Enable foreign key constraint enforcement
-        conn.execute("PRAGMA foreign_keys = ON")
+        # WAL, synchronous=NORMAL, cache sizes and foreign keys, as init_db sets them.
+        # Pooled connections keep these, so they only run when a connection is opened.
+        conn.executescript(CONNECTION_PRAGMAS_SQL)
+        # Wait on locks instead of failing fast
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.pool_key = db_path
         return conn
     except sqlite3.Error as e:
         logging.error(f"Database connection error: {e}")
         return None
 
 
-def add_scraped_post(db_conn: sqlite3.Connection, post_data: dict, group_id: int) -> int | None:
+def release_db_connection(conn: sqlite3.Connection | None) -> None:
+    """
+    Returns a connection obtained from get_db_connection() to the pool.
+
+    Any open transaction is rolled back first. The connection is closed instead
+    when the pool is already full.
+
+    Args:
+        conn: Connection to release; None is ignored.
+    """
+    if conn is None:
+        return
+
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error as e:
+        # Already closed or otherwise unusable, so don't hand it out again
+        logging.warning(f"Discarding database connection: {e}")
+        return
+
+    pool_key = getattr(conn, "pool_key", None)
+    if pool_key is None:
+        conn.close()
+        return
+
+    pool = _pools.setdefault(pool_key, queue.LifoQueue(DB_POOL_SIZE))
+    try:
+        pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+@atexit.register
+def close_pooled_connections() -> None:
+    """
+    Closes every idle pooled connection.
+
+    Runs at interpreter exit, so the last connection to close checkpoints the WAL.
+    """
+    for pool in _pools.values():
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logging.warning(f"Error closing pooled database connection: {e}")
+
+
+_INSERT_POST_COLUMNS = """
+    group_id, facebook_post_id, post_url, post_content_raw, posted_at, scraped_at,
+    post_author_name, post_author_profile_pic_url, post_image_url
+"""
+
+_INSERT_POST_SQL = f"""
+    INSERT OR IGNORE INTO Posts ({_INSERT_POST_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# RETURNING (SQLite 3.35+) hands back the id of a newly inserted post in the same
+# statement. An ignored duplicate writes nothing and returns no row.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_INSERT_POST_RETURNING_SQL = f"{_INSERT_POST_SQL} RETURNING internal_post_id"
+
+
+def add_scraped_post(
+    db_conn: sqlite3.Connection, post_data: dict, group_id: int, commit: bool = True
+) -> int | None:
     """
     Inserts a new scraped post into the database for a specific group.
     Avoids duplicates based on post_url.
@@ -50,98 +263,155 @@ def add_scraped_post(db_conn: sqlite3.Connection, post_data: dict, group_id: int
         db_conn: Database connection
         post_data: Dictionary containing post data
         group_id: ID of the group this post belongs to
+        commit: Commit immediately. Pass False to batch several writes into the
+            caller's transaction; the caller then commits (or rolls back).
 
     Returns:
         The internal_post_id if the post was successfully added or already existed,
         None otherwise.
     """
-    sql = """
-        INSERT OR IGNORE INTO Posts (
-            group_id, facebook_post_id, post_url, post_content_raw, posted_at, scraped_at,
-            post_author_name, post_author_profile_pic_url, post_image_url
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
+    post_url = post_data.get("post_url")
+    params = (
+        group_id,
+        post_data.get("facebook_post_id"),
+        post_url,
+        post_data.get("content_text"),
+        post_data.get("posted_at"),
+        int(time.time()),
+        post_data.get("post_author_name"),
+        post_data.get("post_author_profile_pic_url"),
+        post_data.get("post_image_url"),
+    )
     try:
         cursor = db_conn.cursor()
+        if _HAS_RETURNING:
+            # Drain the statement before committing so the insert is fully applied
+            rows = cursor.execute(_INSERT_POST_RETURNING_SQL, params).fetchall()
+            internal_post_id = rows[0][0] if rows else None
+        else:
+            cursor.execute(_INSERT_POST_SQL, params)
+            internal_post_id = cursor.lastrowid if cursor.rowcount > 0 else None
+        if commit:
+            db_conn.commit()
+        if internal_post_id is not None:
+            logging.info(f"Added new post: {post_url} with ID {internal_post_id}")
+            return internal_post_id
+
+        # Only duplicates pay for the lookup of the id already stored
+        logging.info(f"Post already exists (ignored): {post_url}. Retrieving existing ID.")
         cursor.execute(
-            sql,
-            (
-                group_id,
-                post_data.get("facebook_post_id"),
-                post_data.get("post_url"),
-                post_data.get("content_text"),
-                post_data.get("posted_at"),
-                int(time.time()),
-                post_data.get("post_author_name"),
-                post_data.get("post_author_profile_pic_url"),
-                post_data.get("post_image_url"),
-            ),
+            "SELECT internal_post_id FROM Posts WHERE group_id = ? AND post_url = ?",
+            (group_id, post_url),
         )
-        db_conn.commit()
-        if cursor.rowcount > 0:
-            internal_post_id = cursor.lastrowid
-            logging.info(f"Added new post: {post_data.get('post_url')} with ID {internal_post_id}")
-            return internal_post_id
-        else:
-            logging.info(
-                f"Post already exists (ignored): {post_data.get('post_url')}. Retrieving existing ID."
-            )
-            cursor.execute(
-                "SELECT internal_post_id FROM Posts WHERE group_id = ? AND post_url = ?",
-                (group_id, post_data.get("post_url")),
-            )
-            existing_id = cursor.fetchone()
-            if existing_id:
-                return existing_id[0]
-            return None
+        existing_id = cursor.fetchone()
+        if existing_id:
+            return existing_id[0]
+        return None
     except sqlite3.Error as e:
-        logging.error(f"Error adding post {post_data.get('post_url')}: {e}")
-        db_conn.rollback()
+        logging.error(f"Error adding post {post_url}: {e}")
+        if commit:
+            db_conn.rollback()
         return None
 
 
-def update_post_with_ai_results(db_conn: sqlite3.Connection, internal_post_id: int, ai_data: dict):
+_UPDATE_POST_AI_SQL = """
+    UPDATE Posts
+    SET
+        ai_category = ?,
+        ai_sub_category = ?,
+        ai_keywords = ?,
+        ai_summary = ?,
+        ai_is_potential_idea = ?,
+        ai_reasoning = ?,
+        ai_raw_response = ?,
+        ai_raw_response_zstd = ?,
+        is_processed_by_ai = 1,
+        last_ai_processing_at = ?
+    WHERE internal_post_id = ?
+"""
+
+
+def _raw_response_columns(raw_response: str) -> tuple[None, bytes]:
     """
-    Updates an existing post with AI categorization results.
+    Splits a raw AI response into (ai_raw_response, ai_raw_response_zstd) values.
+
+    New responses are always stored compressed; the TEXT column is cleared and is
+    only read for rows written before compression was added.
     """
-    sql = """
-        UPDATE Posts
-        SET
-            ai_category = ?,
-            ai_sub_category = ?,
-            ai_keywords = ?,
-            ai_summary = ?,
-            ai_is_potential_idea = ?,
-            ai_reasoning = ?,
-            ai_raw_response = ?,
-            is_processed_by_ai = 1,
-            last_ai_processing_at = ?
-        WHERE internal_post_id = ?
+    return None, _compress(raw_response)
+
+
+def _post_ai_params(internal_post_id: int, ai_data: dict, processed_at: int) -> tuple:
+    """Builds the _UPDATE_POST_AI_SQL parameters for one post."""
+    return (
+        ai_data.get("ai_category"),
+        ai_data.get("ai_sub_category"),
+        _dumps(_keyword_list(ai_data.get("ai_keywords"))),
+        ai_data.get("ai_summary"),
+        int(ai_data.get("ai_is_potential_idea", 0)),
+        ai_data.get("ai_reasoning"),
+        *_raw_response_columns(_dumps(ai_data.get("ai_raw_response", {}))),
+        processed_at,
+        internal_post_id,
+    )
+
+
+def update_post_with_ai_results(
+    db_conn: sqlite3.Connection, internal_post_id: int, ai_data: dict, commit: bool = True
+):
+    """
+    Updates an existing post with AI categorization results.
+    Pass commit=False to leave the write in the caller's transaction.
     """
     try:
         cursor = db_conn.cursor()
         cursor.execute(
-            sql,
-            (
-                ai_data.get("ai_category"),
-                ai_data.get("ai_sub_category"),
-                json.dumps(ai_data.get("ai_keywords", [])),
-                ai_data.get("ai_summary"),
-                int(ai_data.get("ai_is_potential_idea", 0)),
-                ai_data.get("ai_reasoning"),
-                json.dumps(ai_data.get("ai_raw_response", {})),
-                int(time.time()),
-                internal_post_id,
-            ),
+            _UPDATE_POST_AI_SQL, _post_ai_params(internal_post_id, ai_data, int(time.time()))
         )
-        db_conn.commit()
+        if commit:
+            db_conn.commit()
         if cursor.rowcount > 0:
             logging.info(f"Updated post {internal_post_id} with AI results.")
         else:
             logging.warning(f"Attempted to update non-existent post: {internal_post_id}")
     except sqlite3.Error as e:
         logging.error(f"Error updating post {internal_post_id}: {e}")
+        if commit:
+            db_conn.rollback()
+
+
+def update_posts_with_ai_results_bulk(
+    db_conn: sqlite3.Connection, updates: list[tuple[int, dict]]
+) -> int:
+    """
+    Updates several posts with AI categorization results in a single transaction.
+
+    Args:
+        db_conn: Database connection
+        updates: List of (internal_post_id, ai_data) pairs
+
+    Returns:
+        The number of posts updated.
+    """
+    if not updates:
+        return 0
+
+    processed_at = int(time.time())
+    rows = [
+        _post_ai_params(internal_post_id, ai_data, processed_at)
+        for internal_post_id, ai_data in updates
+    ]
+    try:
+        if not db_conn.in_transaction:
+            db_conn.execute("BEGIN IMMEDIATE")
+        cursor = db_conn.executemany(_UPDATE_POST_AI_SQL, rows)
+        db_conn.commit()
+        logging.info(f"Updated {cursor.rowcount} posts with AI results.")
+        return cursor.rowcount
+    except sqlite3.Error as e:
+        logging.error(f"Error updating {len(updates)} posts with AI results: {e}")
         db_conn.rollback()
+        return 0
 
 
 def get_unprocessed_posts(db_conn: sqlite3.Connection, group_id: int) -> list[dict]:
@@ -166,19 +436,28 @@ def get_unprocessed_posts(db_conn: sqlite3.Connection, group_id: int) -> list[di
         params.append(group_id)
 
     try:
+        # Plain tuples skip building a sqlite3.Row per post just to copy it into a dict
         cursor = db_conn.cursor()
+        cursor.row_factory = None
         cursor.execute(base_sql, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return [
+            {"internal_post_id": post_id, "post_content_raw": content}
+            for post_id, content in cursor
+        ]
     except sqlite3.Error as e:
         logging.error(f"Error retrieving unprocessed posts: {e}")
         return []
 
 
 def add_comments_for_post(
-    db_conn: sqlite3.Connection, internal_post_id: int, comments_data: list[dict]
+    db_conn: sqlite3.Connection,
+    internal_post_id: int,
+    comments_data: list[dict],
+    commit: bool = True,
 ) -> bool:
     """
     Inserts a list of comments for a given post into the database.
+    Pass commit=False to leave the inserts in the caller's transaction.
     """
     if not comments_data:
         return True
@@ -189,26 +468,30 @@ def add_comments_for_post(
             comment_text, comment_facebook_id, comment_scraped_at
         ) VALUES (?, ?, ?, ?, ?, ?)
     """
+    scraped_at = int(time.time())
+    rows = [
+        (
+            internal_post_id,
+            comment.get("commenterName"),
+            comment.get("commenterProfilePic"),
+            comment.get("commentText"),
+            comment.get("commentFacebookId"),
+            scraped_at,
+        )
+        for comment in comments_data
+    ]
     try:
-        cursor = db_conn.cursor()
-        for comment in comments_data:
-            cursor.execute(
-                sql,
-                (
-                    internal_post_id,
-                    comment.get("commenterName"),
-                    comment.get("commenterProfilePic"),
-                    comment.get("commentText"),
-                    comment.get("commentFacebookId"),
-                    int(time.time()),
-                ),
-            )
-        db_conn.commit()
+        if not db_conn.in_transaction:
+            db_conn.execute("BEGIN IMMEDIATE")
+        db_conn.executemany(sql, rows)
+        if commit:
+            db_conn.commit()
         logging.info(f"Added {len(comments_data)} comments for post {internal_post_id}.")
         return True
     except sqlite3.Error as e:
         logging.error(f"Error adding comments for post {internal_post_id}: {e}")
-        db_conn.rollback()
+        if commit:
+            db_conn.rollback()
         return False
 
 
@@ -242,8 +525,9 @@ def get_all_categorized_posts(
     filters: dict,
     filter_field: str | None = None,
     filter_value: str | int | None = None,
-) -> list[dict]:
-    limit = filters.pop("limit", None) if filters else None
+    as_iterator: bool = False,
+    columns: Sequence[str] | None = None,
+) -> list[dict] | Iterator[dict]:
     """
     Retrieves all posts from a specific group that have been processed by AI, filtered by the provided criteria.
 
@@ -260,16 +544,33 @@ def get_all_categorized_posts(
             min_comments: minimum number of comments on the post.
             max_comments: maximum number of comments on the post.
             is_idea: filter for posts marked as potential ideas (ai_is_potential_idea = 1).
+            ai_category, post_author_name, ai_is_potential_idea: exact match on that
+                column (ALLOWED_FILTER_FIELDS), as set by the interactive view menu.
+            limit: maximum number of posts to return.
+            The dictionary is only read, never modified.
+        as_iterator: If True, yield posts lazily from the cursor instead of building a list.
+        columns: Posts columns to fetch (see POST_COLUMNS); all of them when None.
+            internal_post_id is always included.
 
     Returns:
-        List of dictionaries representing posts that match all the filters.
-    """
-    base_query = """
-        SELECT Posts.*,
-            (SELECT COUNT(*) FROM Comments WHERE Comments.internal_post_id = Posts.internal_post_id) as comment_count
-        FROM Posts
-        LEFT JOIN Comments ON Posts.internal_post_id = Comments.internal_post_id
+        List (or iterator) of dictionaries representing posts that match all the filters.
     """
+    filters = filters or {}
+    limit = filters.get("limit")
+
+    if columns is None:
+        select_columns = "Posts.*"
+    else:
+        unknown = [column for column in columns if column not in POST_COLUMNS]
+        if unknown:
+            logging.warning(f"Ignoring unknown Posts columns: {unknown}")
+        selected = ["internal_post_id"]
+        selected += [c for c in columns if c in POST_COLUMNS and c != "internal_post_id"]
+        # The raw response lives in either column depending on how it was stored
+        if "ai_raw_response" in selected and "ai_raw_response_zstd" not in selected:
+            selected.append("ai_raw_response_zstd")
+        select_columns = ", ".join(f"Posts.{column}" for column in selected)
+
     conditions = ["Posts.is_processed_by_ai = 1"]
     params = []
 
@@ -277,20 +578,30 @@ def get_all_categorized_posts(
         conditions.append("Posts.group_id = ?")
         params.append(group_id)
 
+    # Exact-match filters: the explicit field/value pair, plus any column-named keys
+    # the interactive view menu puts in filters
+    exact_filters = [(column, filters[column]) for column in ALLOWED_FILTER_FIELDS & filters.keys()]
     if filter_field and filter_value is not None:
         if filter_field not in ALLOWED_FILTER_FIELDS:
             logging.warning(f"Field {filter_field} is not allowed for filtering.")
         else:
-            if filter_field == "ai_is_potential_idea":
-                try:
-                    filter_value = int(filter_value)
-                except ValueError:
-                    logging.error(f"Invalid value for boolean field {filter_field}: {filter_value}")
-                    filter_value = None
-
-            if filter_value is not None:
-                conditions.append(f"Posts.{filter_field} = ?")
-                params.append(filter_value)
+            exact_filters.append((filter_field, filter_value))
+
+    for column, value in sorted(exact_filters):
+        if value is None:
+            continue
+        if column == "ai_is_potential_idea":
+            try:
+                value = int(value)
+            except ValueError:
+                logging.error(f"Invalid value for boolean field {column}: {value}")
+                continue
+        conditions.append(f"Posts.{column} = ?")
+        params.append(value)
+
+    if filters.get("category"):
+        conditions.append("Posts.ai_category = ?")
+        params.append(filters["category"])
 
     if filters.get("start_date"):
         conditions.append("Posts.posted_at >= ?")
@@ -312,12 +623,23 @@ def get_all_categorized_posts(
         conditions.append("(Posts.post_content_raw LIKE ? OR Comments.comment_text LIKE ?)")
         params.extend([keyword_pattern, keyword_pattern])
 
-    if conditions:
-        sql = base_query + " WHERE " + " AND ".join(conditions)
-    else:
-        sql = base_query
+    if filters.get("is_idea"):
+        conditions.append("Posts.ai_is_potential_idea = 1")
 
-    sql += " GROUP BY Posts.internal_post_id"
+    # Only join Comments when a filter looks at them; otherwise every comment would
+    # multiply the post rows just for GROUP BY to collapse them again
+    join = ""
+    if filters.get("comment_author") or filters.get("keyword"):
+        join = "LEFT JOIN Comments ON Posts.internal_post_id = Comments.internal_post_id"
+
+    sql = f"""
+        SELECT {select_columns},
+            (SELECT COUNT(*) FROM Comments WHERE Comments.internal_post_id = Posts.internal_post_id) as comment_count
+        FROM Posts
+        {join}
+        WHERE {" AND ".join(conditions)}
+        GROUP BY Posts.internal_post_id
+    """
 
     having_conditions = []
     if filters.get("min_comments") is not None:
@@ -330,63 +652,42 @@ def get_all_categorized_posts(
     if having_conditions:
         sql += " HAVING " + " AND ".join(having_conditions)
 
-    if filters.get("is_idea"):
-        if "is_idea" in filters and filters["is_idea"]:
-            if "Posts.ai_is_potential_idea = 1" not in " AND ".join(conditions) and filters.get(
-                "is_idea"
-            ):
-                conditions.append("Posts.ai_is_potential_idea = 1")
-                sql = (
-                    base_query
-                    + " WHERE "
-                    + " AND ".join(conditions)
-                    + " GROUP BY Posts.internal_post_id"
-                )
-                if having_conditions:
-                    sql += " HAVING " + " AND ".join(having_conditions)
-
     sql += " ORDER BY Posts.posted_at DESC"
 
     if limit and limit > 0:
         sql += " LIMIT ?"
         params.append(limit)
 
-    logging.debug(f"Executing SQL for get_all_categorized_posts: {sql} with params: {params}")
+    logging.debug("Executing SQL for get_all_categorized_posts: %s with params: %s", sql, params)
 
     try:
         cursor = db_conn.cursor()
+        cursor.row_factory = None
         cursor.execute(sql, params)
-        results = []
-        for row in cursor.fetchall():
-            post_dict = dict(row)
-            if "ai_keywords" in post_dict and post_dict["ai_keywords"]:
-                try:
-                    post_dict["ai_keywords"] = json.loads(post_dict["ai_keywords"])
-                except json.JSONDecodeError:
-                    logging.warning(
-                        f"Could not parse keywords JSON for post {post_dict.get('internal_post_id')}"
-                    )
-                    post_dict["ai_keywords"] = []
-            else:
-                post_dict["ai_keywords"] = []
-
-            if "ai_raw_response" in post_dict and post_dict["ai_raw_response"]:
-                try:
-                    post_dict["ai_raw_response"] = json.loads(post_dict["ai_raw_response"])
-                except json.JSONDecodeError:
-                    logging.warning(
-                        f"Could not parse raw response JSON for post {post_dict.get('internal_post_id')}"
-                    )
-                    pass
-            post_dict["ai_is_potential_idea"] = bool(post_dict.get("ai_is_potential_idea", 0))
-
-            results.append(post_dict)
-        return results
+        posts = map(_hydrate_categorized_post, _dict_rows(cursor))
+        if as_iterator:
+            return posts
+        return list(posts)
     except sqlite3.Error as e:
         logging.error(f"Error retrieving categorized posts: {e}")
         return []
 
 
+def _hydrate_categorized_post(post_dict: dict) -> dict:
+    """Decodes the JSON columns of a categorized post in place and returns it."""
+    post_dict["ai_keywords"] = _keyword_list(post_dict.get("ai_keywords"))
+
+    # The raw response is rarely read, so defer parsing it until something asks
+    compressed = post_dict.pop("ai_raw_response_zstd", None)
+    if compressed:
+        post_dict["ai_raw_response"] = LazyJSON(compressed, compressed=True)
+    elif "ai_raw_response" in post_dict and post_dict["ai_raw_response"]:
+        post_dict["ai_raw_response"] = LazyJSON(post_dict["ai_raw_response"])
+    post_dict["ai_is_potential_idea"] = bool(post_dict.get("ai_is_potential_idea", 0))
+
+    return post_dict
+
+
 def get_comments_for_post(db_conn: sqlite3.Connection, internal_post_id: int) -> list[dict]:
     """
     Retrieves all comments for a given post.
@@ -399,13 +700,89 @@ def get_comments_for_post(db_conn: sqlite3.Connection, internal_post_id: int) ->
     """
     try:
         cursor = db_conn.cursor()
+        cursor.row_factory = None
         cursor.execute(sql, (internal_post_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        return list(_dict_rows(cursor))
     except sqlite3.Error as e:
         logging.error(f"Error retrieving comments for post {internal_post_id}: {e}")
         return []
 
 
+def get_comments_for_posts(
+    db_conn: sqlite3.Connection, internal_post_ids: list[int]
+) -> dict[int, list[dict]]:
+    """
+    Retrieves the comments for several posts at once.
+
+    Args:
+        db_conn: Database connection
+        internal_post_ids: IDs of the posts to get comments for
+
+    Returns:
+        Dictionary mapping each post ID that has comments to its list of comments,
+        ordered by comment_scraped_at.
+    """
+    comments_by_post: dict[int, list[dict]] = {}
+    try:
+        cursor = db_conn.cursor()
+        cursor.row_factory = None
+        # Chunk the IN list to stay under SQLite's bound-parameter limit
+        for start in range(0, len(internal_post_ids), COMMENT_BATCH_SIZE):
+            chunk = internal_post_ids[start : start + COMMENT_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(
+                f"""
+                SELECT *
+                FROM Comments
+                WHERE internal_post_id IN ({placeholders})
+                ORDER BY internal_post_id, comment_scraped_at ASC
+                """,
+                chunk,
+            )
+            for comment in _dict_rows(cursor):
+                comments_by_post.setdefault(comment["internal_post_id"], []).append(comment)
+        return comments_by_post
+    except sqlite3.Error as e:
+        logging.error(f"Error retrieving comments for {len(internal_post_ids)} posts: {e}")
+        return {}
+
+
+def has_unprocessed_items(db_conn: sqlite3.Connection, group_id: int | None = None) -> bool:
+    """
+    Checks whether any post or comment is still waiting for AI processing.
+
+    Each EXISTS stops at the first match in the partial "unprocessed" indexes, so
+    this stays cheap however large the tables grow.
+
+    Args:
+        db_conn: Database connection
+        group_id: Only consider posts from this group (comments are always considered)
+
+    Returns:
+        True if there is anything to process, or if the check itself failed.
+    """
+    post_sql = """
+        SELECT 1 FROM Posts
+        WHERE is_processed_by_ai = 0 AND post_content_raw IS NOT NULL
+    """
+    params = []
+    if group_id is not None:
+        post_sql += " AND group_id = ?"
+        params.append(group_id)
+    sql = f"""
+        SELECT EXISTS ({post_sql})
+            OR EXISTS (
+                SELECT 1 FROM Comments
+                WHERE is_processed_by_ai_comment = 0 AND comment_text IS NOT NULL
+            )
+    """
+    try:
+        return bool(db_conn.execute(sql, params).fetchone()[0])
+    except sqlite3.Error as e:
+        logging.error(f"Error checking for unprocessed items: {e}")
+        return True
+
+
 def get_unprocessed_comments(db_conn: sqlite3.Connection) -> list[dict]:
     """
     Retrieves comments that have not yet been processed by AI for comment analysis.
@@ -418,50 +795,95 @@ def get_unprocessed_comments(db_conn: sqlite3.Connection) -> list[dict]:
     """
     try:
         cursor = db_conn.cursor()
+        cursor.row_factory = None
         cursor.execute(sql)
-        return [dict(row) for row in cursor.fetchall()]
+        return [{"comment_id": comment_id, "comment_text": text} for comment_id, text in cursor]
     except sqlite3.Error as e:
         logging.error(f"Error retrieving unprocessed comments: {e}")
         return []
 
 
-def update_comment_with_ai_results(db_conn: sqlite3.Connection, comment_id: int, ai_data: dict):
+_UPDATE_COMMENT_AI_SQL = """
+    UPDATE Comments
+    SET
+        ai_comment_category = ?,
+        ai_comment_sentiment = ?,
+        ai_comment_keywords = ?,
+        ai_comment_raw_response = ?,
+        is_processed_by_ai_comment = 1,
+        last_ai_processing_at_comment = ?
+    WHERE comment_id = ?
+"""
+
+
+def _comment_ai_params(comment_id: int, ai_data: dict, processed_at: int) -> tuple:
+    """Builds the _UPDATE_COMMENT_AI_SQL parameters for one comment."""
+    return (
+        ai_data.get("ai_comment_category"),
+        ai_data.get("ai_comment_sentiment"),
+        _dumps(_keyword_list(ai_data.get("ai_comment_keywords"))),
+        _dumps(ai_data.get("ai_comment_raw_response", {})),
+        processed_at,
+        comment_id,
+    )
+
+
+def update_comment_with_ai_results(
+    db_conn: sqlite3.Connection, comment_id: int, ai_data: dict, commit: bool = True
+):
     """
     Updates a comment record with AI analysis results.
     Sets is_processed_by_ai_comment = 1 and updates processing timestamp.
-    """
-    sql = """
-        UPDATE Comments
-        SET
-            ai_comment_category = ?,
-            ai_comment_sentiment = ?,
-            ai_comment_keywords = ?,
-            ai_comment_raw_response = ?,
-            is_processed_by_ai_comment = 1,
-            last_ai_processing_at_comment = ?
-        WHERE comment_id = ?
+    Pass commit=False to leave the write in the caller's transaction.
     """
     try:
         cursor = db_conn.cursor()
         cursor.execute(
-            sql,
-            (
-                ai_data.get("ai_comment_category"),
-                ai_data.get("ai_comment_sentiment"),
-                json.dumps(ai_data.get("ai_comment_keywords", [])),
-                json.dumps(ai_data.get("ai_comment_raw_response", {})),
-                int(time.time()),
-                comment_id,
-            ),
+            _UPDATE_COMMENT_AI_SQL, _comment_ai_params(comment_id, ai_data, int(time.time()))
         )
-        db_conn.commit()
+        if commit:
+            db_conn.commit()
         if cursor.rowcount > 0:
             logging.info(f"Updated comment {comment_id} with AI results.")
         else:
             logging.warning(f"Attempted to update non-existent comment: {comment_id}")
     except sqlite3.Error as e:
         logging.error(f"Error updating comment {comment_id}: {e}")
+        if commit:
+            db_conn.rollback()
+
+
+def update_comments_with_ai_results_bulk(
+    db_conn: sqlite3.Connection, updates: list[tuple[int, dict]]
+) -> int:
+    """
+    Updates several comments with AI analysis results in a single transaction.
+
+    Args:
+        db_conn: Database connection
+        updates: List of (comment_id, ai_data) pairs
+
+    Returns:
+        The number of comments updated.
+    """
+    if not updates:
+        return 0
+
+    processed_at = int(time.time())
+    rows = [
+        _comment_ai_params(comment_id, ai_data, processed_at) for comment_id, ai_data in updates
+    ]
+    try:
+        if not db_conn.in_transaction:
+            db_conn.execute("BEGIN IMMEDIATE")
+        cursor = db_conn.executemany(_UPDATE_COMMENT_AI_SQL, rows)
+        db_conn.commit()
+        logging.info(f"Updated {cursor.rowcount} comments with AI results.")
+        return cursor.rowcount
+    except sqlite3.Error as e:
+        logging.error(f"Error updating {len(updates)} comments with AI results: {e}")
         db_conn.rollback()
+        return 0
 
 
 def add_group(db_conn: sqlite3.Connection, name: str, url: str) -> int | None:
@@ -491,6 +913,50 @@ def add_group(db_conn: sqlite3.Connection, name: str, url: str) -> int | None:
         return None
 
 
+_INSERT_GROUP_SQL = "INSERT OR IGNORE INTO Groups (group_name, group_url) VALUES (?, ?)"
+# As for posts, RETURNING hands back a new group's id; a known URL writes nothing
+# and returns no row
+_INSERT_GROUP_RETURNING_SQL = f"{_INSERT_GROUP_SQL} RETURNING group_id"
+
+
+def upsert_group(db_conn: sqlite3.Connection, name: str, url: str) -> int | None:
+    """
+    Returns the group_id for a URL, creating the group if it doesn't exist yet.
+
+    Args:
+        db_conn: Database connection
+        name: Name to give the group if it has to be created
+        url: URL of the Facebook group
+
+    Returns:
+        The group_id if found or created, None otherwise.
+    """
+    try:
+        cursor = db_conn.cursor()
+        if _HAS_RETURNING:
+            rows = cursor.execute(_INSERT_GROUP_RETURNING_SQL, (name, url)).fetchall()
+            group_id = rows[0][0] if rows else None
+        else:
+            cursor.execute(_INSERT_GROUP_SQL, (name, url))
+            group_id = cursor.lastrowid if cursor.rowcount > 0 else None
+        db_conn.commit()
+        if group_id is not None:
+            return group_id
+
+        # Only a known URL pays for the lookup of the id already stored
+        cursor.execute("SELECT group_id FROM Groups WHERE group_url = ?", (url,))
+        existing = cursor.fetchone()
+        if existing:
+            return existing[0]
+        # The insert was ignored for another reason: the name belongs to another group
+        logging.warning(f"Could not create group for {url}: name '{name}' is already in use")
+        return None
+    except sqlite3.Error as e:
+        logging.error(f"Error getting/creating group for {url}: {e}")
+        db_conn.rollback()
+        return None
+
+
 def get_group_by_id(db_conn: sqlite3.Connection, group_id: int) -> dict | None:
     """
     Retrieves a group by its ID.
@@ -551,8 +1017,9 @@ def list_groups(db_conn: sqlite3.Connection) -> list[dict]:
     """
     try:
         cursor = db_conn.cursor()
+        cursor.row_factory = None
         cursor.execute(sql)
-        return [dict(row) for row in cursor.fetchall()]
+        return list(_dict_rows(cursor))
     except sqlite3.Error as e:
         logging.error(f"Error listing groups: {e}")
         return []
@@ -584,7 +1051,7 @@ def remove_group(db_conn: sqlite3.Connection, group_id: int) -> bool:
 
 
 if __name__ == "__main__":
-    from db_setup import init_db
+    from database.db_setup import init_db
 
     init_db()
     conn = get_db_connection()
@@ -656,4 +1123,4 @@ if __name__ == "__main__":
         comments = get_comments_for_post(conn, post_id)
         logging.info(f"Comments for post {post_id}: {comments}")
 
-        conn.close()
+        release_db_connection(conn)
@@ -18,6 +18,156 @@ def get_db_path(db_name: str = "insights.db") -> str:
         return db_name
 
 
+# Bump when SCHEMA_SQL or the migrations in init_db change. Stored in the database's
+# user_version so an up-to-date file skips the schema script on every start.
+SCHEMA_VERSION = 1
+
+# Use write-ahead logging so commits don't fsync the whole rollback journal.
+# journal_mode is persisted in the database file; the rest are per-connection,
+# so every connection the app opens runs this script.
+CONNECTION_PRAGMAS_SQL = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536; -- 64 MiB page cache
+PRAGMA mmap_size = 268435456; -- 256 MiB
+
+-- Enable foreign key constraint enforcement
+PRAGMA foreign_keys = ON;
+"""
+
+# The PRAGMAs must run outside the transaction that wraps the DDL.
+SCHEMA_SQL = (
+    CONNECTION_PRAGMAS_SQL
+    + """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS Groups (
+    group_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_name TEXT UNIQUE NOT NULL,
+    group_url TEXT UNIQUE NOT NULL,
+    last_scraped_at TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS Posts (
+    internal_post_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_id INTEGER NOT NULL,
+    facebook_post_id TEXT UNIQUE,
+    post_url TEXT UNIQUE,
+    post_content_raw TEXT,
+    post_author_name TEXT,
+    post_author_profile_pic_url TEXT,
+    post_image_url TEXT,
+    posted_at TIMESTAMP,
+    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ai_category TEXT,
+    ai_sub_category TEXT,
+    ai_keywords TEXT, -- Storing as JSON string
+    ai_summary TEXT,
+    ai_is_potential_idea INTEGER DEFAULT 0, -- 0 for False, 1 for True
+    ai_reasoning TEXT,
+    ai_raw_response TEXT, -- Storing as JSON string
+    ai_raw_response_zstd BLOB, -- zstd-compressed JSON, used instead of ai_raw_response
+    is_processed_by_ai INTEGER DEFAULT 0, -- 0 for False, 1 for True
+    last_ai_processing_at TIMESTAMP,
+    FOREIGN KEY (group_id) REFERENCES Groups(group_id)
+);
+
+CREATE TABLE IF NOT EXISTS Comments (
+    comment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    internal_post_id INTEGER,
+    commenter_name TEXT,
+    commenter_profile_pic_url TEXT,
+    comment_text TEXT,
+    comment_facebook_id TEXT UNIQUE,
+    comment_scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ai_comment_category TEXT,
+    ai_comment_sentiment TEXT,
+    ai_comment_keywords TEXT,
+    ai_comment_raw_response TEXT,
+    is_processed_by_ai_comment INTEGER DEFAULT 0,
+    last_ai_processing_at_comment TIMESTAMP,
+    FOREIGN KEY (internal_post_id) REFERENCES Posts(internal_post_id)
+);
+
+-- Indexes for the hot filters: AI-processing queues, categorized post listings,
+-- and per-post comment lookups
+CREATE INDEX IF NOT EXISTS idx_posts_unprocessed
+ON Posts(is_processed_by_ai) WHERE is_processed_by_ai = 0;
+
+CREATE INDEX IF NOT EXISTS idx_posts_cat_date
+ON Posts(ai_category, posted_at DESC) WHERE is_processed_by_ai = 1;
+
+CREATE INDEX IF NOT EXISTS idx_posts_processed_date
+ON Posts(posted_at DESC) WHERE is_processed_by_ai = 1;
+
+-- Exact author matches (Posts.post_author_name = ?) from the view filter menu
+CREATE INDEX IF NOT EXISTS idx_posts_author
+ON Posts(post_author_name, posted_at DESC) WHERE is_processed_by_ai = 1;
+
+CREATE INDEX IF NOT EXISTS idx_comments_post
+ON Comments(internal_post_id, comment_scraped_at);
+
+CREATE INDEX IF NOT EXISTS idx_comments_unprocessed
+ON Comments(is_processed_by_ai_comment) WHERE is_processed_by_ai_comment = 0;
+
+-- Row counts kept up to date by triggers, so statistics don't need COUNT(*) scans
+CREATE TABLE IF NOT EXISTS Counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+-- Seed each counter from the existing rows the first time it is created
+INSERT INTO Counters (name, value)
+SELECT 'posts_total', (SELECT COUNT(*) FROM Posts)
+WHERE NOT EXISTS (SELECT 1 FROM Counters WHERE name = 'posts_total');
+
+INSERT INTO Counters (name, value)
+SELECT 'posts_unprocessed', (SELECT COUNT(*) FROM Posts WHERE is_processed_by_ai = 0)
+WHERE NOT EXISTS (SELECT 1 FROM Counters WHERE name = 'posts_unprocessed');
+
+INSERT INTO Counters (name, value)
+SELECT 'comments_total', (SELECT COUNT(*) FROM Comments)
+WHERE NOT EXISTS (SELECT 1 FROM Counters WHERE name = 'comments_total');
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_insert_counters AFTER INSERT ON Posts
+BEGIN
+    UPDATE Counters SET value = value + 1 WHERE name = 'posts_total';
+    UPDATE Counters SET value = value + (NEW.is_processed_by_ai IS 0)
+    WHERE name = 'posts_unprocessed';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_delete_counters AFTER DELETE ON Posts
+BEGIN
+    UPDATE Counters SET value = value - 1 WHERE name = 'posts_total';
+    UPDATE Counters SET value = value - (OLD.is_processed_by_ai IS 0)
+    WHERE name = 'posts_unprocessed';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_processed_counters
+AFTER UPDATE OF is_processed_by_ai ON Posts
+WHEN OLD.is_processed_by_ai IS NOT NEW.is_processed_by_ai
+BEGIN
+    UPDATE Counters
+    SET value = value + (NEW.is_processed_by_ai IS 0) - (OLD.is_processed_by_ai IS 0)
+    WHERE name = 'posts_unprocessed';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_comments_insert_counters AFTER INSERT ON Comments
+BEGIN
+    UPDATE Counters SET value = value + 1 WHERE name = 'comments_total';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_comments_delete_counters AFTER DELETE ON Comments
+BEGIN
+    UPDATE Counters SET value = value - 1 WHERE name = 'comments_total';
+END;
+
+COMMIT;
+"""
+)
+
+
 def init_db(db_name: str = "insights.db"):
     """
     Initializes the SQLite database and creates required tables if they don't exist.
@@ -33,63 +183,28 @@ def init_db(db_name: str = "insights.db"):
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
 
-        # Enable foreign key constraint enforcement
-        cursor.execute("PRAGMA foreign_keys = ON")
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Groups (
-                group_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                group_name TEXT UNIQUE NOT NULL,
-                group_url TEXT UNIQUE NOT NULL,
-                last_scraped_at TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Posts (
-                internal_post_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                group_id INTEGER NOT NULL,
-                facebook_post_id TEXT UNIQUE,
-                post_url TEXT UNIQUE,
-                post_content_raw TEXT,
-                post_author_name TEXT,
-                post_author_profile_pic_url TEXT,
-                post_image_url TEXT,
-                posted_at TIMESTAMP,
-                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                ai_category TEXT,
-                ai_sub_category TEXT,
-                ai_keywords TEXT, -- Storing as JSON string
-                ai_summary TEXT,
-                ai_is_potential_idea INTEGER DEFAULT 0, -- 0 for False, 1 for True
-                ai_reasoning TEXT,
-                ai_raw_response TEXT, -- Storing as JSON string
-                is_processed_by_ai INTEGER DEFAULT 0, -- 0 for False, 1 for True
-                last_ai_processing_at TIMESTAMP,
-                FOREIGN KEY (group_id) REFERENCES Groups(group_id)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Comments (
-                comment_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                internal_post_id INTEGER,
-                commenter_name TEXT,
-                commenter_profile_pic_url TEXT,
-                comment_text TEXT,
-                comment_facebook_id TEXT UNIQUE,
-                comment_scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                ai_comment_category TEXT,
-                ai_comment_sentiment TEXT,
-                ai_comment_keywords TEXT,
-                ai_comment_raw_response TEXT,
-                is_processed_by_ai_comment INTEGER DEFAULT 0,
-                last_ai_processing_at_comment TIMESTAMP,
-                FOREIGN KEY (internal_post_id) REFERENCES Posts(internal_post_id)
-            )
-        """)
-
-        conn.commit()
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= SCHEMA_VERSION:
+            logging.info(f"Database '{db_path}' schema is up to date.")
+            return
+
+        # One call runs the PRAGMAs and the whole schema in a single transaction
+        conn.executescript(SCHEMA_SQL)
+
+        # Databases created before compressed AI responses lack the BLOB column
+        cursor.execute("PRAGMA table_info(Posts)")
+        if "ai_raw_response_zstd" not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE Posts ADD COLUMN ai_raw_response_zstd BLOB")
+            conn.commit()
+
+        # Gather planner statistics once so the indexes get picked up
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            cursor.execute("ANALYZE")
+            conn.commit()
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
         logging.info(
             f"Database '{db_path}' initialized with Groups and Posts tables created or verified."
         )
@@ -4,12 +4,18 @@ import sqlite3
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+def get_counter(conn: sqlite3.Connection, name: str) -> int:
+    """Get a trigger-maintained row count from the Counters table."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT value FROM Counters WHERE name = ?;", (name,))
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+
 def get_total_posts(conn: sqlite3.Connection) -> int:
     """Get total number of posts in database."""
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Posts;")
-        return cursor.fetchone()[0]
+        return get_counter(conn, "posts_total")
     except sqlite3.Error as e:
         logging.error(f"Error getting total posts: {e}")
         return 0
@@ -34,9 +40,7 @@ def get_posts_per_category(conn: sqlite3.Connection) -> list:
 def get_unprocessed_posts_count(conn: sqlite3.Connection) -> int:
     """Get count of unprocessed posts."""
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Posts WHERE is_processed_by_ai = 0;")
-        return cursor.fetchone()[0]
+        return get_counter(conn, "posts_unprocessed")
     except sqlite3.Error as e:
         logging.error(f"Error getting unprocessed posts count: {e}")
         return 0
@@ -45,9 +49,7 @@ def get_unprocessed_posts_count(conn: sqlite3.Connection) -> int:
 def get_total_comments(conn: sqlite3.Connection) -> int:
     """Get total number of comments."""
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Comments;")
-        return cursor.fetchone()[0]
+        return get_counter(conn, "comments_total")
     except sqlite3.Error as e:
         logging.error(f"Error getting total comments: {e}")
         return 0
@@ -92,15 +94,61 @@ def get_top_authors(conn: sqlite3.Connection, limit: int = 5) -> list:
         return []
 
 
+def get_summary_counts(conn: sqlite3.Connection) -> dict:
+    """Get the scalar post/comment statistics with a single query."""
+    try:
+        cursor = conn.cursor()
+        # Totals come from the trigger-maintained Counters; only the average needs a scan
+        cursor.execute("""
+            WITH totals AS (
+                SELECT
+                    MAX(CASE WHEN name = 'posts_total' THEN value END) AS posts_total,
+                    MAX(CASE WHEN name = 'posts_unprocessed' THEN value END) AS unprocessed,
+                    MAX(CASE WHEN name = 'comments_total' THEN value END) AS comments_total
+                FROM Counters
+            ),
+            pc AS (
+                SELECT AVG(comment_count) AS average
+                FROM (
+                    SELECT COUNT(comment_id) AS comment_count
+                    FROM Comments
+                    GROUP BY internal_post_id
+                )
+            )
+            SELECT
+                IFNULL(totals.posts_total, 0),
+                IFNULL(totals.unprocessed, 0),
+                IFNULL(totals.comments_total, 0),
+                pc.average
+            FROM totals, pc;
+        """)
+        total_posts, unprocessed, total_comments, average = cursor.fetchone()
+        return {
+            "total_posts": total_posts,
+            "unprocessed_posts": unprocessed,
+            "total_comments": total_comments,
+            "avg_comments_per_post": round(average, 2) if average is not None else 0.0,
+        }
+    except sqlite3.Error as e:
+        logging.error(f"Error getting summary counts: {e}")
+        return {
+            "total_posts": 0,
+            "unprocessed_posts": 0,
+            "total_comments": 0,
+            "avg_comments_per_post": 0.0,
+        }
+
+
 def get_all_statistics(conn: sqlite3.Connection) -> dict:
     """Get all statistics in a single dictionary."""
     try:
+        summary = get_summary_counts(conn)
         return {
-            "total_posts": get_total_posts(conn),
+            "total_posts": summary["total_posts"],
             "posts_per_category": get_posts_per_category(conn),
-            "unprocessed_posts": get_unprocessed_posts_count(conn),
-            "total_comments": get_total_comments(conn),
-            "avg_comments_per_post": get_avg_comments_per_post(conn),
+            "unprocessed_posts": summary["unprocessed_posts"],
+            "total_comments": summary["total_comments"],
+            "avg_comments_per_post": summary["avg_comments_per_post"],
             "top_authors": get_top_authors(conn),
         }
     except Exception as e:
@@ -1,14 +1,23 @@
 import csv
-import json
+import itertools
 import logging
 import os
 import sqlite3
+import sys
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
+
 from database import crud
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Export files are written through a 1 MiB buffer so rows reach the OS in large chunks
+EXPORT_BUFFER_SIZE = 1 << 20
+PARQUET_ROW_GROUP_SIZE = 100_000
+
 
 def get_output_paths(base_path: str, file_format: str = "csv") -> dict[str, str]:
     """
@@ -16,16 +25,16 @@ def get_output_paths(base_path: str, file_format: str = "csv") -> dict[str, str]
 
     Args:
         base_path: Original output path provided by user
-        file_format: Export format (csv/json)
+        file_format: Export format (csv/json/parquet)
 
     Returns:
         Dictionary mapping data types to their absolute file paths
     """
     abs_path = os.path.abspath(base_path)
 
-    if not os.path.isdir(abs_path) and os.path.splitext(os.path.basename(abs_path))[0]:
+    filename = os.path.splitext(os.path.basename(abs_path))[0]
+    if filename and not os.path.isdir(abs_path):
         base_dir = os.path.dirname(abs_path)
-        filename = os.path.splitext(os.path.basename(abs_path))[0]
     else:
         base_dir = abs_path
         filename = "fbdata"
@@ -38,9 +47,10 @@ def get_output_paths(base_path: str, file_format: str = "csv") -> dict[str, str]
         "combined": os.path.join(base_dir, f"{filename}_all{ext}"),
     }
 
-    logging.info("Generated export paths:")
-    for data_type, file_path in paths.items():
-        logging.info(f"  {data_type}: {file_path}")
+    logging.info(
+        "Generated export paths:\n"
+        + "\n".join(f"  {data_type}: {file_path}" for data_type, file_path in paths.items())
+    )
 
     return paths
 
@@ -58,11 +68,25 @@ def ensure_dir_exists(file_path: str) -> None:
         raise
 
 
+def _iter_comments(conn: sqlite3.Connection, post_ids: Iterable[int]) -> Iterator[dict]:
+    """Yields the comments of the given posts, post by post, in batches of post IDs."""
+    post_ids = iter(post_ids)
+    while batch := list(itertools.islice(post_ids, crud.COMMENT_BATCH_SIZE)):
+        comments_by_post = crud.get_comments_for_posts(conn, batch)
+        for post_id in batch:
+            yield from comments_by_post.get(post_id, ())
+
+
 def fetch_data_for_export(
     conn: sqlite3.Connection, filters: dict, entity: str = "posts"
-) -> dict[str, list[dict]]:
+) -> dict[str, Iterable[dict]]:
     """
-    Fetches data from database based on filters and entity type.
+    Prepares the data to export based on filters and entity type.
+
+    Nothing is read up front: each entry streams its rows from the database when it
+    is iterated, so only the rows currently being written are held in memory. Each
+    entry can be iterated once. When posts are exported too, read them before the
+    comments so the comments reuse their IDs instead of querying the posts again.
 
     Args:
         conn: Database connection
@@ -70,189 +94,512 @@ def fetch_data_for_export(
         entity: Type of data to export (posts, comments, groups, or all)
 
     Returns:
-        Dictionary containing lists of posts, comments, groups, and combined data
+        Dictionary containing iterables of posts, comments and groups
     """
-    result = {"posts": [], "comments": [], "groups": [], "combined": []}
-
-    try:
-        if entity in ["groups", "all"]:
-            result["groups"] = crud.list_groups(conn)
-            result["combined"].extend(result["groups"])
-
-        if entity in ["posts", "all"]:
-            result["posts"] = crud.get_all_categorized_posts(conn, None, filters)
-            result["combined"].extend(result["posts"])
-
-        if entity in ["comments", "all"]:
-            fetched_posts = crud.get_all_categorized_posts(conn, None, filters)
-            for post in fetched_posts:
-                comments = crud.get_comments_for_post(conn, post["internal_post_id"])
-                result["comments"].extend(comments)
-                result["combined"].extend(comments)
-
-    except Exception as e:
-        logging.error(f"Error fetching data: {e}")
-        return {"posts": [], "comments": [], "groups": [], "combined": []}
+    result: dict[str, Iterable[dict]] = {"posts": (), "comments": (), "groups": ()}
+    # Filled in by the posts stream once it has been read to the end
+    post_ids: list[int] | None = None
+
+    def iter_posts() -> Iterator[dict]:
+        nonlocal post_ids
+        ids = []
+        for post in crud.get_all_categorized_posts(conn, None, filters, as_iterator=True):
+            ids.append(post["internal_post_id"])
+            yield post
+        post_ids = ids
+
+    def iter_comments() -> Iterator[dict]:
+        ids = post_ids
+        if ids is None:
+            # Only the post IDs are read, so the post rows themselves are not fetched
+            ids = [
+                post["internal_post_id"]
+                for post in crud.get_all_categorized_posts(
+                    conn, None, filters, as_iterator=True, columns=["internal_post_id"]
+                )
+            ]
+        yield from _iter_comments(conn, ids)
+
+    if entity in ["groups", "all"]:
+        result["groups"] = iter(crud.list_groups(conn))
+
+    if entity in ["posts", "all"]:
+        result["posts"] = iter_posts()
+
+    if entity in ["comments", "all"]:
+        result["comments"] = iter_comments()
 
     return result
 
 
-def normalize_records(records: list[dict], record_type: str) -> tuple[list[dict], list[str]]:
+# Columns listed first in each single-type export
+_ESSENTIAL_FIELDS = {
+    "posts": frozenset(
+        ["post_url", "post_author_name", "post_content_raw", "posted_at", "ai_category"]
+    ),
+    "comments": frozenset(["comment_id", "commenter_name", "comment_text"]),
+    "groups": frozenset(["group_id", "group_name", "group_url"]),
+}
+
+_COMBINED_FIELDNAMES = [
+    "record_type",
+    "id",
+    "author",
+    "content",
+    "timestamp",
+    "category",
+    "url",
+    "post_id",
+    "name",
+]
+
+# record_type -> (combined keys, source keys)
+_COMBINED_MAPPINGS = {
+    "post": (
+        ("id", "author", "content", "timestamp", "category", "url"),
+        (
+            "internal_post_id",
+            "post_author_name",
+            "post_content_raw",
+            "posted_at",
+            "ai_category",
+            "post_url",
+        ),
+    ),
+    "comment": (
+        ("id", "author", "content", "timestamp", "post_id"),
+        ("comment_id", "commenter_name", "comment_text", "commented_at", "post_id"),
+    ),
+    "group": (
+        ("id", "name", "url"),
+        ("group_id", "group_name", "group_url"),
+    ),
+}
+# Field identifying the source table of records that carry no record_type tag
+_COMBINED_MARKERS = (
+    ("post_content_raw", "post"),
+    ("comment_text", "comment"),
+    ("group_url", "group"),
+)
+
+
+def normalize_records(
+    records: Iterable[dict], record_type: str, reorder: bool = True
+) -> tuple[Iterator[dict], list[str]]:
     """
     Normalizes records to have consistent fields and returns fieldnames.
 
+    Records are normalized lazily, so large exports never hold every row in memory.
+
     Args:
-        records: List of dictionaries with potentially different fields
+        records: Iterable of dictionaries with potentially different fields
         record_type: Type of records ('posts', 'comments', 'groups', 'combined')
+        reorder: Rebuild each single-table record as a dict in fieldnames order. Writers
+            that pull values by field name themselves (CSV) pass False and get the
+            source records back unchanged; combined records are always mapped.
 
     Returns:
-        Tuple of (normalized records list, fieldnames list)
+        Tuple of (normalized records iterator, fieldnames list)
     """
-    if not records:
-        return [], []
-
-    ESSENTIAL_FIELDS = {
-        "posts": ["post_url", "post_author_name", "post_content_raw", "posted_at", "ai_category"],
-        "comments": ["comment_id", "commenter_name", "comment_text"],
-        "groups": ["group_id", "group_name", "group_url"],
-        "combined": ["record_type", "id", "author", "content", "timestamp", "category"],
-    }
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return iter(()), []
+    records = itertools.chain([first], records)
 
     if record_type == "combined":
-        normalized = []
-        for record in records:
-            if "post_content_raw" in record:
-                normalized_record = {
-                    "record_type": "post",
-                    "id": record.get("internal_post_id"),
-                    "author": record.get("post_author_name"),
-                    "content": record.get("post_content_raw"),
-                    "timestamp": record.get("posted_at"),
-                    "category": record.get("ai_category"),
-                    "url": record.get("post_url"),
-                }
-            elif "comment_text" in record:
-                normalized_record = {
-                    "record_type": "comment",
-                    "id": record.get("comment_id"),
-                    "author": record.get("commenter_name"),
-                    "content": record.get("comment_text"),
-                    "timestamp": record.get("commented_at"),
-                    "post_id": record.get("post_id"),
-                }
-            elif "group_url" in record:
-                normalized_record = {
-                    "record_type": "group",
-                    "id": record.get("group_id"),
-                    "name": record.get("group_name"),
-                    "url": record.get("group_url"),
-                }
-            else:
+        return _normalize_combined(records), list(_COMBINED_FIELDNAMES)
+
+    # Records of one type all come from the same table, so the first one
+    # carries the full set of columns
+    essential = _ESSENTIAL_FIELDS.get(record_type, frozenset())
+    fieldnames = list(essential) + sorted(first.keys() - essential)
+    if not reorder:
+        return records, fieldnames
+    return _normalize_single(records, fieldnames), fieldnames
+
+
+def _normalize_single(records: Iterable[dict], fieldnames: list[str]) -> Iterator[dict]:
+    """Reorders single-table records into fieldnames order, filling missing fields with None."""
+    row_values = itemgetter(*fieldnames)
+    for record in records:
+        try:
+            yield dict(zip(fieldnames, row_values(record), strict=True))
+        except KeyError:
+            yield {field: record.get(field) for field in fieldnames}
+
+
+def _combine_record(record: dict, record_type: str) -> dict:
+    """Maps a post, comment or group record onto the shared combined-export fields."""
+    keys, source_keys = _COMBINED_MAPPINGS[record_type]
+    normalized = {"record_type": record_type}
+    normalized.update(zip(keys, map(record.get, source_keys), strict=True))
+    return normalized
+
+
+def _normalize_combined(records: Iterable[dict]) -> Iterator[dict]:
+    """Maps posts, comments and groups onto the shared combined-export fields."""
+    for record in records:
+        record_type = record.get("record_type")
+        if record_type is None:
+            record_type = next(
+                (kind for marker, kind in _COMBINED_MARKERS if marker in record), None
+            )
+            if record_type is None:
                 continue
-            normalized.append(normalized_record)
-
-        fieldnames = [
-            "record_type",
-            "id",
-            "author",
-            "content",
-            "timestamp",
-            "category",
-            "url",
-            "post_id",
-            "name",
+        yield _combine_record(record, record_type)
+
+
+class _CsvRows:
+    """Iterates records as CSV value rows in fieldnames order, counting them as it goes."""
+
+    def __init__(self, records: Iterable[dict], fieldnames: list[str]):
+        self._records = iter(records)
+        self._fieldnames = fieldnames
+        # Pull each row's values in column order in one C call
+        self._row_values = itemgetter(*fieldnames)
+        self.rows = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        record = next(self._records)
+        self.rows += 1
+        try:
+            return self._row_values(record)
+        except KeyError:
+            # Combined records carry only a subset of the columns, and source rows may
+            # lack a column the first row had
+            return [record.get(field) for field in self._fieldnames]
+
+
+def _json_default(obj):
+    """Serializes values orjson can't handle natively (lazily parsed columns)."""
+    if isinstance(obj, crud.LazyJSON):
+        return obj.value()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Low-cardinality text columns. The Parquet writer holds every row until the table is
+# built, so these are interned to keep one copy of each repeated value.
+_CATEGORICAL_FIELDS = frozenset(
+    [
+        "record_type",
+        "ai_category",
+        "ai_sub_category",
+        "post_author_name",
+        "commenter_name",
+        "ai_comment_category",
+        "ai_comment_sentiment",
+    ]
+)
+
+
+# Columns whose values are always lists and are written as Parquet list columns
+_LIST_FIELDS = frozenset(["ai_keywords"])
+
+
+class _ParquetColumns:
+    """
+    Gathers records into one column list per field for a Parquet table.
+
+    Parquet needs one type per column, so nested values (lists and dicts) are stored
+    as JSON text, and so is every decoded raw AI response that isn't already a string.
+    Only list-valued columns (ai_keywords) keep their lists.
+    """
+
+    def __init__(self, fieldnames: list[str]):
+        self._columns = {field: [] for field in fieldnames}
+        self._appenders = [
+            (field, self._columns[field].append, field in _CATEGORICAL_FIELDS)
+            for field in fieldnames
         ]
-        return normalized, fieldnames
+        self.rows = 0
+
+    def append(self, record: dict) -> None:
+        for field, append, categorical in self._appenders:
+            value = record.get(field)
+            if categorical and value.__class__ is str:
+                value = sys.intern(value)
+            elif isinstance(value, crud.LazyJSON):
+                # A raw response may decode to any JSON value
+                value = value.value()
+                if value is not None and not isinstance(value, str):
+                    value = orjson.dumps(value).decode()
+            elif isinstance(value, (dict, list)) and field not in _LIST_FIELDS:
+                value = orjson.dumps(value).decode()
+            append(value)
+        self.rows += 1
+
+    def write(self, abs_path: str) -> None:
+        """Writes the gathered columns to a zstd-compressed Parquet file."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(
+            pa.table(self._columns),
+            abs_path,
+            compression="zstd",
+            use_dictionary=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+        )
 
-    else:
-        essential = set(ESSENTIAL_FIELDS.get(record_type, []))
-        optional = set()
-        for record in records:
-            optional.update(record.keys())
 
-        fieldnames = list(essential) + sorted(list(optional - essential))
+def _write_parquet(records: Iterable[dict], abs_path: str, fieldnames: list[str]) -> int:
+    """
+    Writes records to a zstd-compressed Parquet file and returns how many were written.
+
+    Parquet is columnar, so the records are gathered into one column list per field first.
+    """
+    columns = _ParquetColumns(fieldnames)
+    for record in records:
+        columns.append(record)
+    columns.write(abs_path)
+    return columns.rows
+
 
-        normalized = []
-        for record in records:
-            normalized_record = {field: record.get(field) for field in fieldnames}
-            normalized.append(normalized_record)
+def _json_framing(pretty: bool) -> tuple[int, bytes, bytes]:
+    """Returns the orjson option, record separator and first separator for a JSON array."""
+    if pretty:
+        return orjson.OPT_INDENT_2, b",\n  ", b"\n  "
+    return 0, b",", b""
 
-        return normalized, fieldnames
+
+def _encode_json_record(record: dict, option: int) -> bytes:
+    """Encodes one record for a JSON array, indenting it as an array element if needed."""
+    encoded = orjson.dumps(record, default=_json_default, option=option)
+    if option:
+        encoded = encoded.replace(b"\n", b"\n  ")
+    return encoded
 
 
 def write_data_file(
-    records: list[dict],
+    records: Iterable[dict],
     file_path: str,
     data_type: str,
     format_type: str,
     normalize_fn=None,
     **kwargs,
-) -> None:
+) -> int:
     """Helper function to write data to a file with proper error handling and logging.
 
+    Records are consumed one at a time and written as they arrive.
+
     Args:
-        records: List of records to write
+        records: Iterable of records to write
         file_path: Path to output file
         data_type: Type of data being written ('posts', 'comments', etc.)
-        format_type: Format being written ('CSV' or 'JSON')
-        normalize_fn: Optional function to normalize records before writing
+        format_type: Format being written ('CSV', 'JSON' or 'PARQUET')
+        normalize_fn: Optional function to normalize records before writing; called as
+            normalize_fn(records, data_type, reorder=...) like normalize_records
         **kwargs: Additional arguments for specific format writers
-    """
-    if not records:
-        return
+            (csv.writer dialect options, or pretty=True to indent JSON output)
 
-    abs_path = os.path.abspath(file_path)
+    Returns:
+        The number of records written; no file is created when there are none.
+    """
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return 0
+    records = itertools.chain([first], records)
+
+    # Paths from get_output_paths are already absolute
+    abs_path = file_path if os.path.isabs(file_path) else os.path.abspath(file_path)
     try:
-        logging.info(f"Attempting to export {len(records)} {data_type} to {abs_path}")
+        logging.info(f"Attempting to export {data_type} to {abs_path}")
 
         if normalize_fn:
-            records, fieldnames = normalize_fn(records, data_type)
+            # _CsvRows reads each row's values by field name, so CSV skips the
+            # per-record dict that reorders fields for JSON and Parquet
+            records, fieldnames = normalize_fn(records, data_type, reorder=format_type != "CSV")
             kwargs["fieldnames"] = fieldnames
 
-        open_args = kwargs.pop("open_args", {})
-        with open(abs_path, "w", encoding="utf-8", **open_args) as f:
-            if format_type == "CSV":
-                writer = csv.DictWriter(f, **kwargs)
-                writer.writeheader()
-                writer.writerows(records)
-            else:
-                json.dump(records, f, ensure_ascii=False, indent=4)
-
-        logging.info(f"Successfully exported {len(records)} {data_type} to {abs_path}")
+        exported = 0
+        if format_type == "CSV":
+            open_args = kwargs.pop("open_args", {})
+            with open(
+                abs_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE, **open_args
+            ) as f:
+                fieldnames = kwargs.pop("fieldnames")
+                writer = csv.writer(f, **kwargs)
+                writer.writerow(fieldnames)
+                counted = _CsvRows(records, fieldnames)
+                writer.writerows(counted)
+                exported = counted.rows
+        elif format_type == "PARQUET":
+            exported = _write_parquet(records, abs_path, kwargs["fieldnames"])
+        else:
+            # orjson encodes each record straight to UTF-8 bytes; the array brackets and
+            # separators are written by hand so records never pile up in memory
+            option, separator, first_separator = _json_framing(kwargs.get("pretty", False))
+            with open(abs_path, "wb", buffering=EXPORT_BUFFER_SIZE) as f:
+                f.write(b"[")
+                for record in records:
+                    f.write(separator if exported else first_separator)
+                    f.write(_encode_json_record(record, option))
+                    exported += 1
+                f.write(b"\n]" if option else b"]")
+
+        logging.info(f"Successfully exported {exported} {data_type} to {abs_path}")
+        return exported
     except Exception as e:
         logging.error(f"Failed to write {data_type} {format_type} file: {e}")
         raise
 
 
-def export_to_csv(data: dict[str, list[dict]], output_path: str):
+class _CombinedWriter:
+    """
+    Writes the combined file from records teed off the per-table exports.
+
+    Every post, comment and group is passed to add() while its own file is being
+    written, so the combined file needs no second read of the database. The file is
+    only created once the first record arrives.
+    """
+
+    def __init__(self, file_path: str, format_type: str, **kwargs):
+        self._abs_path = file_path if os.path.isabs(file_path) else os.path.abspath(file_path)
+        self._format_type = format_type
+        self._kwargs = kwargs
+        self._file = None
+        self._parquet = None
+        self._write = None
+        self._json_option = 0
+        self.rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> None:
+        logging.info(f"Attempting to export combined to {self._abs_path}")
+        if self._format_type == "CSV":
+            open_args = self._kwargs.get("open_args", {})
+            self._file = open(
+                self._abs_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE, **open_args
+            )
+            writer = csv.writer(self._file)
+            writer.writerow(_COMBINED_FIELDNAMES)
+            self._write = lambda record: writer.writerow(
+                [record.get(field) for field in _COMBINED_FIELDNAMES]
+            )
+        elif self._format_type == "PARQUET":
+            self._parquet = _ParquetColumns(_COMBINED_FIELDNAMES)
+            self._write = self._parquet.append
+        else:
+            option, separator, first_separator = _json_framing(self._kwargs.get("pretty", False))
+            self._file = open(self._abs_path, "wb", buffering=EXPORT_BUFFER_SIZE)
+            self._file.write(b"[")
+            self._json_option = option
+
+            def write_json(record: dict) -> None:
+                self._file.write(separator if self.rows else first_separator)
+                self._file.write(_encode_json_record(record, option))
+
+            self._write = write_json
+
+    def add(self, record: dict, record_type: str) -> None:
+        """Writes one post, comment or group record to the combined file."""
+        try:
+            if self._write is None:
+                self._open()
+            self._write(_combine_record(record, record_type))
+            self.rows += 1
+        except Exception as e:
+            logging.error(f"Failed to write combined {self._format_type} file: {e}")
+            raise
+
+    def finish(self) -> int:
+        """Completes the combined file and returns how many records it holds."""
+        if self._write is None:
+            return 0
+        try:
+            if self._format_type == "PARQUET":
+                self._parquet.write(self._abs_path)
+            else:
+                if self._format_type == "JSON":
+                    self._file.write(b"\n]" if self._json_option else b"]")
+                self._file.close()
+                self._file = None
+        except Exception as e:
+            logging.error(f"Failed to write combined {self._format_type} file: {e}")
+            raise
+        logging.info(f"Successfully exported {self.rows} combined to {self._abs_path}")
+        return self.rows
+
+
+def _tee_combined(
+    records: Iterable[dict], record_type: str, combined: _CombinedWriter
+) -> Iterator[dict]:
+    """Yields records unchanged, adding each one to the combined file on the way."""
+    for record in records:
+        combined.add(record, record_type)
+        yield record
+
+
+# Table exports in combined-file order, with each table's combined record_type
+_EXPORT_ORDER = (("groups", "group"), ("posts", "post"), ("comments", "comment"))
+
+
+def _write_export_files(
+    data: dict[str, Iterable[dict]], paths: dict[str, str], format_type: str, **kwargs
+) -> dict[str, int]:
+    """
+    Writes one file per table plus the combined file in a single pass over the data.
+
+    Args:
+        data: Dictionary containing iterables of posts, comments and groups
+        paths: Output paths from get_output_paths
+        format_type: Format being written ('CSV', 'JSON' or 'PARQUET')
+        **kwargs: Additional arguments for write_data_file
+
+    Returns:
+        Number of records written for each data type
+    """
+    exported = {}
+    with _CombinedWriter(paths["combined"], format_type, **kwargs) as combined:
+        for data_type, record_type in _EXPORT_ORDER:
+            exported[data_type] = write_data_file(
+                records=_tee_combined(data.get(data_type, ()), record_type, combined),
+                file_path=paths[data_type],
+                data_type=data_type,
+                format_type=format_type,
+                normalize_fn=normalize_records,
+                **kwargs,
+            )
+        exported["combined"] = combined.finish()
+    return exported
+
+
+def export_to_csv(data: dict[str, Iterable[dict]], output_path: str) -> dict[str, int]:
     """
     Exports data to separate CSV files for each table and a combined file.
 
     Args:
-        data: Dictionary containing lists of posts, comments, groups and combined data
+        data: Dictionary containing iterables of posts, comments and groups
         output_path: Base path for output files
 
     Raises:
         OSError: If directory creation or file writing fails
+
+    Returns:
+        Number of records written for each data type
     """
     paths = get_output_paths(output_path, "csv")
 
-    base_dir = os.path.dirname(os.path.abspath(list(paths.values())[0]))
+    base_dir = os.path.dirname(paths["posts"])
     try:
         ensure_base_dir(base_dir)
     except Exception as e:
         logging.error(f"Failed to create/verify export directory: {e}")
         raise
 
-    for data_type, file_path in paths.items():
-        write_data_file(
-            records=data[data_type],
-            file_path=file_path,
-            data_type=data_type,
-            format_type="CSV",
-            normalize_fn=normalize_records,
-            open_args={"newline": ""},
-        )
+    return _write_export_files(data, paths, "CSV", open_args={"newline": ""})
 
 
 def ensure_base_dir(base_path: str) -> None:
@@ -272,31 +619,66 @@ def ensure_base_dir(base_path: str) -> None:
     logging.info(f"Using export directory: {base_path}")
 
 
-def export_to_json(data: dict[str, list[dict]], output_path: str):
+def export_to_json(
+    data: dict[str, Iterable[dict]], output_path: str, pretty: bool = False
+) -> dict[str, int]:
     """
     Exports data to separate JSON files for each table and a combined file.
 
     Args:
-        data: Dictionary containing lists of posts, comments, groups and combined data
+        data: Dictionary containing iterables of posts, comments and groups
         output_path: Base path for output files
+        pretty: Indent the JSON output (2 spaces) instead of writing it compactly
 
     Raises:
         OSError: If directory creation or file writing fails
+
+    Returns:
+        Number of records written for each data type
     """
     paths = get_output_paths(output_path, "json")
 
-    base_dir = os.path.dirname(os.path.abspath(list(paths.values())[0]))
+    base_dir = os.path.dirname(paths["posts"])
     try:
         ensure_base_dir(base_dir)
     except Exception as e:
         logging.error(f"Failed to create/verify export directory: {e}")
         raise
 
-    for data_type, file_path in paths.items():
-        write_data_file(
-            records=data[data_type],
-            file_path=file_path,
-            data_type=data_type,
-            format_type="JSON",
-            normalize_fn=normalize_records,
-        )
+    return _write_export_files(data, paths, "JSON", pretty=pretty)
+
+
+def export_to_parquet(data: dict[str, Iterable[dict]], output_path: str) -> dict[str, int]:
+    """
+    Exports data to separate Parquet files for each table and a combined file.
+
+    Requires the optional pyarrow package.
+
+    Args:
+        data: Dictionary containing iterables of posts, comments and groups
+        output_path: Base path for output files
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        OSError: If directory creation or file writing fails
+
+    Returns:
+        Number of records written for each data type
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires pyarrow. Install with: pip install -r requirements-parquet.txt"
+        ) from e
+
+    paths = get_output_paths(output_path, "parquet")
+
+    base_dir = os.path.dirname(paths["posts"])
+    try:
+        ensure_base_dir(base_dir)
+    except Exception as e:
+        logging.error(f"Failed to create/verify export directory: {e}")
+        raise
+
+    return _write_export_files(data, paths, "PARQUET")
@@ -1,31 +1,34 @@
-import argparse
-import asyncio
 import logging
 import sqlite3
 import sys
-from datetime import datetime, timezone
 from typing import Optional
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-
-from config import get_db_path, get_env_file_path, is_first_run, run_setup_wizard
+from config import (
+    get_ai_comment_batch_size,
+    get_ai_max_concurrent_batches,
+    get_db_path,
+    get_env_file_path,
+    is_first_run,
+    run_setup_wizard,
+)
 from database.crud import (
     add_comments_for_post,
     add_group,
     add_scraped_post,
     get_all_categorized_posts,
-    get_comments_for_post,
+    get_comments_for_posts,
     get_db_connection,
     get_distinct_values,
     get_group_by_id,
     get_unprocessed_comments,
     get_unprocessed_posts,
+    has_unprocessed_items,
     list_groups,
+    release_db_connection,
     remove_group,
-    update_comment_with_ai_results,
-    update_post_with_ai_results,
+    update_comments_with_ai_results_bulk,
+    update_posts_with_ai_results_bulk,
+    upsert_group,
 )
 from database.db_setup import init_db
 from database.stats_queries import get_all_statistics
@@ -38,6 +41,25 @@ logging.getLogger("webdriver_manager").setLevel(logging.WARNING)
 # Current Chrome user-agent string (Chrome 131)
 CHROME_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 
+# Scraped posts are written in one transaction per this many posts
+SCRAPE_COMMIT_INTERVAL = 50
+
+# Columns printed by the view command; the raw AI response is left in the database
+VIEW_POST_COLUMNS = (
+    "post_url",
+    "post_author_name",
+    "post_author_profile_pic_url",
+    "post_image_url",
+    "posted_at",
+    "post_content_raw",
+    "ai_category",
+    "ai_sub_category",
+    "ai_summary",
+    "ai_is_potential_idea",
+    "ai_keywords",
+    "ai_reasoning",
+)
+
 
 def get_or_create_group_id(
     conn: sqlite3.Connection, group_url: str, group_name: str = None
@@ -53,28 +75,9 @@ def get_or_create_group_id(
     Returns:
         group_id if found/created, None on error
     """
-    try:
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT group_id FROM Groups WHERE group_url = ?", (group_url,))
-        existing = cursor.fetchone()
-        if existing:
-            return existing[0]
-
-        if not group_name:
-            group_name = f"Group from {group_url}"
-
-        cursor.execute(
-            "INSERT INTO Groups (group_name, group_url) VALUES (?, ?)",
-            (group_name, group_url),
-        )
-        conn.commit()
-        return cursor.lastrowid
-
-    except sqlite3.Error as e:
-        logging.error(f"Error getting/creating group: {e}")
-        conn.rollback()
-        return None
+    if not group_name:
+        group_name = f"Group from {group_url}"
+    return upsert_group(conn, group_name, group_url)
 
 
 def handle_scrape_command(
@@ -97,7 +100,12 @@ def handle_scrape_command(
 
     logging.info(f"Running scrape command (fetching {num_posts} posts). Headless: {headless}")
 
-    # Import scraper-specific modules here to avoid circular imports
+    # Import scraper-specific modules here to avoid circular imports, and so the
+    # Selenium/webdriver-manager stack only loads for the commands that drive a browser
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
     from config import get_facebook_credentials
     from scraper.facebook_scraper import login_to_facebook, scrape_authenticated_group
 
@@ -140,21 +148,31 @@ def handle_scrape_command(
                 )
                 added_count = 0
                 scraped_count = 0
-                for post in scraped_posts_generator:
-                    scraped_count += 1
-                    try:
-                        internal_post_id = add_scraped_post(conn, post, group_id)
-                        if internal_post_id:
-                            added_count += 1
-                            if post.get("comments"):
-                                add_comments_for_post(conn, internal_post_id, post["comments"])
-                        else:
-                            logging.warning(
-                                f"Failed to add post {post.get('post_url')}. Skipping comments for this post."
-                            )
-                    except Exception as e:
-                        logging.error(f"Error saving post {post.get('post_url')}: {e}")
+                try:
+                    for post in scraped_posts_generator:
+                        scraped_count += 1
+                        try:
+                            internal_post_id = add_scraped_post(conn, post, group_id, commit=False)
+                            if internal_post_id:
+                                added_count += 1
+                                if post.get("comments"):
+                                    add_comments_for_post(
+                                        conn, internal_post_id, post["comments"], commit=False
+                                    )
+                            else:
+                                logging.warning(
+                                    f"Failed to add post {post.get('post_url')}. Skipping comments for this post."
+                                )
+                        except Exception as e:
+                            logging.error(f"Error saving post {post.get('post_url')}: {e}")
+                        if scraped_count % SCRAPE_COMMIT_INTERVAL == 0:
+                            conn.commit()
+                finally:
+                    # Keep whatever was saved even if scraping stops part-way
+                    conn.commit()
                 if scraped_count > 0:
+                    # Refresh planner statistics for the tables that just grew
+                    conn.execute("PRAGMA optimize")
                     logging.info(
                         f"Scraped {scraped_count} posts. Successfully added {added_count} new posts (and their comments) to the database."
                     )
@@ -179,10 +197,39 @@ def handle_scrape_command(
                 logging.warning(f"Error closing WebDriver: {e}")
         if conn:
             try:
-                conn.close()
-                logging.info("Database connection closed.")
+                release_db_connection(conn)
+                logging.info("Database connection released.")
             except Exception as e:
-                logging.warning(f"Error closing database connection: {e}")
+                logging.warning(f"Error releasing database connection: {e}")
+
+
+async def _analyze_batches(analyze, batches: list[list[dict]], label: str, noun: str):
+    """Runs an AI analysis coroutine over batches, a bounded number at a time.
+
+    Args:
+        analyze: Coroutine function taking one batch and returning its AI results
+        batches: Batches of posts or comments to analyze
+        label: Batch name used in log messages (e.g. "batch", "comment batch")
+        noun: Name of the batch items used in log messages (e.g. "posts")
+
+    Yields:
+        (batch index, results) pairs in completion order; results is the raised
+        exception if the batch failed.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(get_ai_max_concurrent_batches())
+
+    async def run(i: int, batch: list[dict]):
+        async with semaphore:
+            logging.info(f"Processing {label} {i + 1}/{len(batches)} with {len(batch)} {noun}...")
+            try:
+                return i, await analyze(batch)
+            except Exception as e:
+                return i, e
+
+    for finished in asyncio.as_completed([run(i, batch) for i, batch in enumerate(batches)]):
+        yield await finished
 
 
 async def handle_process_ai_command(group_id: int = None):
@@ -191,11 +238,27 @@ async def handle_process_ai_command(group_id: int = None):
     Args:
         group_id: Optional ID of the group to process posts from. If None, processes all groups.
     """
+    logging.info("Running process-ai command...")
+
+    conn = get_db_connection()
+    if not conn:
+        logging.error("Could not connect to the database.")
+        return
+    try:
+        pending = has_unprocessed_items(conn, group_id)
+    finally:
+        release_db_connection(conn)
+    # An empty queue needs neither the AI SDKs nor a provider client
+    if not pending:
+        logging.info("No unprocessed posts or comments found in the database.")
+        return
+
+    # asyncio is only needed here, so it isn't imported for every other command
+    import asyncio
+
     from ai.gemini_service import create_post_batches
     from ai.provider_factory import get_ai_provider
 
-    logging.info("Running process-ai command...")
-
     # Get AI provider
     try:
         ai_provider = get_ai_provider()
@@ -219,50 +282,46 @@ async def handle_process_ai_command(group_id: int = None):
             logging.info(f"Retrieved {len(unprocessed_posts)} unprocessed posts from the database.")
             for i, post in enumerate(unprocessed_posts[: min(5, len(unprocessed_posts))]):
                 logging.debug(
-                    f"  Post {i + 1}: ID={post.get('internal_post_id')}, URL={post.get('post_url')}"
+                    "  Post %s: ID=%s, URL=%s",
+                    i + 1,
+                    post.get("internal_post_id"),
+                    post.get("post_url"),
                 )
 
             logging.info(f"Found {len(unprocessed_posts)} unprocessed posts. Creating batches...")
             post_batches = create_post_batches(unprocessed_posts)
 
             processed_count = 0
-            for i, batch in enumerate(post_batches):
-                logging.info(
-                    f"Processing batch {i + 1}/{len(post_batches)} with {len(batch)} posts..."
-                )
-                try:
-                    ai_results = await ai_provider.analyze_posts_batch(batch)
-
-                    if ai_results:
-                        logging.info(
-                            f"Received {len(ai_results)} mapped AI results for batch {i + 1}."
-                        )
-                        for result in ai_results:
-                            internal_post_id = result.get("internal_post_id")
-                            if internal_post_id is not None:
-                                try:
-                                    logging.debug(
-                                        f"Attempting to update post {internal_post_id} with AI results."
-                                    )
-                                    update_post_with_ai_results(conn, internal_post_id, result)
-                                    logging.debug(
-                                        f"Successfully updated post {internal_post_id} with AI results."
-                                    )
-                                    processed_count += 1
-                                except Exception as db_e:
-                                    logging.error(
-                                        f"Error updating post {internal_post_id} with AI results: {db_e}"
-                                    )
-                            else:
-                                logging.error(
-                                    f"AI result missing 'internal_post_id'. Cannot update database for result: {result}"
-                                )
-                    else:
-                        logging.warning(f"No AI results returned or mapped for batch {i + 1}.")
-                except Exception as batch_e:
-                    logging.error(f"Error processing batch {i + 1}: {batch_e}")
+            # Batches are sent concurrently; each is written as soon as it comes back
+            async for i, ai_results in _analyze_batches(
+                ai_provider.analyze_posts_batch, post_batches, "batch", "posts"
+            ):
+                if isinstance(ai_results, Exception):
+                    logging.error(f"Error processing batch {i + 1}: {ai_results}")
+                elif ai_results:
+                    logging.info(f"Received {len(ai_results)} mapped AI results for batch {i + 1}.")
+                    updates = []
+                    for result in ai_results:
+                        internal_post_id = result.get("internal_post_id")
+                        if internal_post_id is not None:
+                            updates.append((internal_post_id, result))
+                        else:
+                            logging.error(
+                                f"AI result missing 'internal_post_id'. Cannot update database for result: {result}"
+                            )
+                    # One transaction for the whole batch, run off the event loop so the
+                    # commit doesn't stall the batches still in flight. Writes stay serial:
+                    # the next one starts only after this await returns.
+                    processed_count += await asyncio.to_thread(
+                        update_posts_with_ai_results_bulk, conn, updates
+                    )
+                else:
+                    logging.warning(f"No AI results returned or mapped for batch {i + 1}.")
 
             logging.info(f"Successfully processed {processed_count} posts with AI.")
+            if processed_count > 0:
+                # Processed posts move into the partial indexes the listings use
+                conn.execute("PRAGMA optimize")
 
         unprocessed_comments = get_unprocessed_comments(conn)
         if not unprocessed_comments:
@@ -271,42 +330,39 @@ async def handle_process_ai_command(group_id: int = None):
             logging.info(
                 f"Found {len(unprocessed_comments)} unprocessed comments. Processing in batches..."
             )
-            batch_size = 5
+            batch_size = get_ai_comment_batch_size()
             comment_batches = [
                 unprocessed_comments[i : i + batch_size]
                 for i in range(0, len(unprocessed_comments), batch_size)
             ]
             processed_comment_count = 0
-            for i, batch in enumerate(comment_batches):
-                logging.info(
-                    f"Processing comment batch {i + 1}/{len(comment_batches)} with {len(batch)} comments..."
-                )
-                try:
-                    ai_comment_results = ai_provider.analyze_comments_batch(batch)
-                    if ai_comment_results:
-                        logging.info(
-                            f"Received {len(ai_comment_results)} mapped AI results for comment batch {i + 1}."
-                        )
-                        for result in ai_comment_results:
-                            comment_id = result.get("comment_id")
-                            if comment_id is not None:
-                                try:
-                                    update_comment_with_ai_results(conn, comment_id, result)
-                                    processed_comment_count += 1
-                                except Exception as db_e:
-                                    logging.error(
-                                        f"Error updating comment {comment_id} with AI results: {db_e}"
-                                    )
-                            else:
-                                logging.error(
-                                    f"AI result missing 'comment_id'. Cannot update database for result: {result}"
-                                )
-                    else:
-                        logging.warning(
-                            f"No AI results returned or mapped for comment batch {i + 1}."
-                        )
-                except Exception as batch_e:
-                    logging.error(f"Error processing comment batch {i + 1}: {batch_e}")
+            # analyze_comments_batch blocks, so each batch runs in a worker thread
+            async for i, ai_comment_results in _analyze_batches(
+                lambda batch: asyncio.to_thread(ai_provider.analyze_comments_batch, batch),
+                comment_batches,
+                "comment batch",
+                "comments",
+            ):
+                if isinstance(ai_comment_results, Exception):
+                    logging.error(f"Error processing comment batch {i + 1}: {ai_comment_results}")
+                elif ai_comment_results:
+                    logging.info(
+                        f"Received {len(ai_comment_results)} mapped AI results for comment batch {i + 1}."
+                    )
+                    updates = []
+                    for result in ai_comment_results:
+                        comment_id = result.get("comment_id")
+                        if comment_id is not None:
+                            updates.append((comment_id, result))
+                        else:
+                            logging.error(
+                                f"AI result missing 'comment_id'. Cannot update database for result: {result}"
+                            )
+                    processed_comment_count += await asyncio.to_thread(
+                        update_comments_with_ai_results_bulk, conn, updates
+                    )
+                else:
+                    logging.warning(f"No AI results returned or mapped for comment batch {i + 1}.")
 
             logging.info(f"Successfully processed {processed_comment_count} comments with AI.")
 
@@ -317,9 +373,9 @@ async def handle_process_ai_command(group_id: int = None):
         )
     finally:
         try:
-            conn.close()
+            release_db_connection(conn)
         except Exception as e:
-            logging.warning(f"Error closing database connection: {e}")
+            logging.warning(f"Error releasing database connection: {e}")
 
 
 def handle_view_command(group_id: int = None, filters: dict = None, limit: int = None):
@@ -333,15 +389,20 @@ def handle_view_command(group_id: int = None, filters: dict = None, limit: int =
     if filters is None:
         filters = {}
 
+    filterable_fields = {
+        "ai_category": "Category",
+        "post_author_name": "Author Name",
+        "ai_is_potential_idea": "Potential Idea",
+    }
+    field_keys = list(filterable_fields)
+    field_menu = "\nAvailable filter fields:\n" + "\n".join(
+        f"{i}. {field_label}" for i, field_label in enumerate(filterable_fields.values(), start=1)
+    )
+    # Distinct values per field, so revisiting a field doesn't rerun SELECT DISTINCT
+    distinct_cache: dict[str, list] = {}
+
     while True:
-        filterable_fields = {
-            "ai_category": "Category",
-            "post_author_name": "Author Name",
-            "ai_is_potential_idea": "Potential Idea",
-        }
-        print("\nAvailable filter fields:")
-        for i, (_field_key, field_label) in enumerate(filterable_fields.items(), start=1):
-            print(f"{i}. {field_label}")
+        print(field_menu)
         print("0. Apply filters and view posts")
         print("-1. Clear all filters")
 
@@ -360,13 +421,17 @@ def handle_view_command(group_id: int = None, filters: dict = None, limit: int =
             filters = {}
             print("All filters cleared.")
         elif 1 <= choice <= len(filterable_fields):
-            selected_key = list(filterable_fields.keys())[choice - 1]
+            selected_key = field_keys[choice - 1]
             selected_label = filterable_fields[selected_key]
 
-            conn = get_db_connection()
-            if conn:
+            distinct_values = distinct_cache.get(selected_key)
+            conn = get_db_connection() if distinct_values is None else None
+            if distinct_values is not None or conn:
                 try:
-                    distinct_values = get_distinct_values(conn, selected_key)
+                    if distinct_values is None:
+                        distinct_values = get_distinct_values(conn, selected_key)
+                        if distinct_values:
+                            distinct_cache[selected_key] = distinct_values
                     if not distinct_values:
                         print(f"No distinct values found for {selected_label}.")
                     else:
@@ -395,7 +460,7 @@ def handle_view_command(group_id: int = None, filters: dict = None, limit: int =
                 except Exception as e:
                     print(f"Error retrieving distinct values: {e}")
                 finally:
-                    conn.close()
+                    release_db_connection(conn)
             else:
                 print("Could not connect to the database.")
         else:
@@ -412,60 +477,70 @@ def handle_view_command(group_id: int = None, filters: dict = None, limit: int =
     conn = get_db_connection()
     if conn:
         try:
+            # Query with a copy so the filters chosen in the menu stay as they are
+            query_filters = dict(filters)
             if limit:
-                filters["limit"] = limit
+                query_filters["limit"] = limit
 
-            filter_field = filters.pop("field", None)
-            filter_value = filters.pop("value", None) if "value" in filters else None
-
-            posts = (
-                get_all_categorized_posts(conn, group_id, filters, filter_field, filter_value)
-                if group_id
-                else get_all_categorized_posts(conn, None, filters, filter_field, filter_value)
+            # Menu selections are keyed by column name and become exact matches in SQL
+            posts = get_all_categorized_posts(
+                conn, group_id or None, query_filters, columns=VIEW_POST_COLUMNS
             )
             if not posts:
                 print("No categorized posts found in the database.")
                 return
 
-            print(f"Found {len(posts)} categorized posts:")
+            # Collect the whole listing and write it once instead of one print per line
+            lines = [f"Found {len(posts)} categorized posts:"]
+            append = lines.append
+            comments_by_post = get_comments_for_posts(
+                conn, [post["internal_post_id"] for post in posts]
+            )
             for post in posts:
-                print("-" * 20)
-                print(f"Post URL: {post.get('post_url', 'N/A')}")
-                print(f"Author: {post.get('post_author_name', 'N/A')}")
-                if post.get("post_author_profile_pic_url"):
-                    print(f"Author Profile Pic: {post['post_author_profile_pic_url']}")
-                if post.get("post_image_url"):
-                    print(f"Post Image: {post['post_image_url']}")
-                print(f"Posted At: {post.get('posted_at', 'N/A')}")
-                print(f"Content: {post.get('post_content_raw', 'N/A')}")
-                print(f"Category: {post.get('ai_category', 'N/A')}")
-                if post.get("ai_sub_category"):
-                    print(f"Sub-category: {post['ai_sub_category']}")
-                print(f"Summary: {post.get('ai_summary', 'N/A')}")
-                print(f"Potential Idea: {'Yes' if post.get('ai_is_potential_idea') else 'No'}")
-                if post.get("ai_keywords"):
-                    if isinstance(post["ai_keywords"], list):
-                        print(f"Keywords: {', '.join(post['ai_keywords'])}")
-                    else:
-                        print(f"Keywords: {post['ai_keywords']}")
-                if post.get("ai_reasoning"):
-                    print(f"Reasoning: {post['ai_reasoning']}")
-
-                comments = get_comments_for_post(conn, post["internal_post_id"])
+                profile_pic = post.get("post_author_profile_pic_url")
+                image_url = post.get("post_image_url")
+                sub_category = post.get("ai_sub_category")
+                keywords = post.get("ai_keywords")
+                reasoning = post.get("ai_reasoning")
+
+                append("-" * 20)
+                append(f"Post URL: {post.get('post_url', 'N/A')}")
+                append(f"Author: {post.get('post_author_name', 'N/A')}")
+                if profile_pic:
+                    append(f"Author Profile Pic: {profile_pic}")
+                if image_url:
+                    append(f"Post Image: {image_url}")
+                append(f"Posted At: {post.get('posted_at', 'N/A')}")
+                append(f"Content: {post.get('post_content_raw', 'N/A')}")
+                append(f"Category: {post.get('ai_category', 'N/A')}")
+                if sub_category:
+                    append(f"Sub-category: {sub_category}")
+                append(f"Summary: {post.get('ai_summary', 'N/A')}")
+                append(f"Potential Idea: {'Yes' if post.get('ai_is_potential_idea') else 'No'}")
+                if keywords:
+                    append(f"Keywords: {', '.join(keywords)}")
+                if reasoning:
+                    append(f"Reasoning: {reasoning}")
+
+                comments = comments_by_post.get(post["internal_post_id"])
                 if comments:
-                    print("  Comments:")
+                    append("  Comments:")
                     for comment in comments:
-                        print(f"    - Commenter: {comment.get('commenter_name', 'N/A')}")
+                        append(f"    - Commenter: {comment.get('commenter_name', 'N/A')}")
                         if comment.get("commenter_profile_pic_url"):
-                            print(f"      Pic: {comment['commenter_profile_pic_url']}")
-                        print(f"      Text: {comment.get('comment_text', 'N/A')}")
+                            append(f"      Pic: {comment['commenter_profile_pic_url']}")
+                        append(f"      Text: {comment.get('comment_text', 'N/A')}")
                 else:
-                    print("  No comments.")
+                    append("  No comments.")
+
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
 
         except Exception as e:
             print(f"An error occurred during viewing posts: {e}")
         finally:
-            conn.close()
+            release_db_connection(conn)
     else:
         print("Could not connect to the database.")
 
@@ -494,36 +569,44 @@ def handle_export_command(args):
         return
 
     try:
-        result = exporter.fetch_data_for_export(conn, filters, args.entity)
+        if getattr(args, "analyze", False):
+            # Let the query planner see the current data before the export queries run
+            logging.info("Analyzing database...")
+            conn.execute("ANALYZE")
+            conn.commit()
 
-        has_data = any(len(data) > 0 for data in result.values())
-        if not has_data:
-            logging.warning("No data found for the specified filters and entity.")
-            return
-
-        paths = exporter.get_output_paths(args.output, args.format)
+        result = exporter.fetch_data_for_export(conn, filters, args.entity)
 
+        # The data is streamed, so emptiness is only known once it has been written
         if args.format == "csv":
-            exporter.export_to_csv(result, args.output)
-            for data_type, path in paths.items():
-                if result[data_type]:
-                    logging.info(
-                        f"Successfully exported {len(result[data_type])} {data_type} to CSV: {path}"
-                    )
+            exported = exporter.export_to_csv(result, args.output)
+            format_label = "CSV"
         elif args.format == "json":
-            exporter.export_to_json(result, args.output)
-            for data_type, path in paths.items():
-                if result[data_type]:
-                    logging.info(
-                        f"Successfully exported {len(result[data_type])} {data_type} to JSON: {path}"
-                    )
+            exported = exporter.export_to_json(result, args.output, pretty=args.pretty)
+            format_label = "JSON"
+        elif args.format == "parquet":
+            exported = exporter.export_to_parquet(result, args.output)
+            format_label = "Parquet"
         else:
             logging.error(f"Unsupported export format: {args.format}")
+            return
+
+        if not any(exported.values()):
+            logging.warning("No data found for the specified filters and entity.")
+            return
+
+        paths = exporter.get_output_paths(args.output, args.format)
+        for data_type, path in paths.items():
+            if exported[data_type]:
+                logging.info(
+                    f"Successfully exported {exported[data_type]} {data_type} "
+                    f"to {format_label}: {path}"
+                )
 
     except Exception as e:
         logging.error(f"Error during export: {e}", exc_info=True)
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def handle_add_group_command(group_name: str, group_url: str):
@@ -544,7 +627,7 @@ def handle_add_group_command(group_name: str, group_url: str):
     except Exception as e:
         logging.error(f"Error adding group: {e}")
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def handle_list_groups_command():
@@ -571,7 +654,7 @@ def handle_list_groups_command():
     except Exception as e:
         logging.error(f"Error listing groups: {e}")
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def handle_remove_group_command(group_id: int):
@@ -596,7 +679,7 @@ def handle_remove_group_command(group_id: int):
     except Exception as e:
         logging.error(f"Error removing group: {e}")
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def handle_stats_command():
@@ -609,24 +692,28 @@ def handle_stats_command():
     try:
         stats = get_all_statistics(conn)
 
-        print("\n===== Database Statistics =====")
-        print(f"Total Posts: {stats['total_posts']}")
-        print(f"Unprocessed Posts: {stats['unprocessed_posts']}")
-        print(f"Total Comments: {stats['total_comments']}")
-        print(f"Average Comments per Post: {stats['avg_comments_per_post']}")
-
-        print("\nPosts per Category:")
-        for category, count in stats["posts_per_category"]:
-            print(f"  {category}: {count}")
-
-        print("\nTop Authors by Post Count:")
-        for author, count in stats["top_authors"]:
-            print(f"  {author}: {count} posts")
+        # Build the report first and write it in one go, as the view command does
+        lines = [
+            "",
+            "===== Database Statistics =====",
+            f"Total Posts: {stats['total_posts']}",
+            f"Unprocessed Posts: {stats['unprocessed_posts']}",
+            f"Total Comments: {stats['total_comments']}",
+            f"Average Comments per Post: {stats['avg_comments_per_post']}",
+            "",
+            "Posts per Category:",
+        ]
+        lines.extend(f"  {category}: {count}" for category, count in stats["posts_per_category"])
+        lines += ["", "Top Authors by Post Count:"]
+        lines.extend(f"  {author}: {count} posts" for author, count in stats["top_authors"])
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     except Exception as e:
         logging.error(f"Error generating statistics: {e}")
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def check_first_run():
@@ -679,19 +766,22 @@ def main():
             logging.error("Failed to connect to database after initialization")
             return
 
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = {row[0] for row in cursor.fetchall()}
         required_tables = {"Groups", "Posts", "Comments"}
+        tables = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (?, ?, ?)",
+                tuple(required_tables),
+            )
+        }
 
         missing_tables = required_tables - tables
         if missing_tables:
             logging.error(f"Missing required tables: {missing_tables}")
-            conn.close()
+            release_db_connection(conn)
             return
 
-        conn.close()
+        release_db_connection(conn)
         logging.info("Database initialized successfully with all required tables.")
     except Exception as e:
         logging.error(f"Database initialization failed: {e}")
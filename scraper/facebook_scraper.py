@@ -298,7 +298,10 @@ def _get_post_identifiers_from_element(
             try:
                 post_id = f"generated_{uuid.uuid4().hex[:12]}"
                 logging.debug(
-                    f"Generated fallback post_id: {post_id} for post at {post_url or 'unknown URL'} in group {group_url_for_logging}"
+                    "Generated fallback post_id: %s for post at %s in group %s",
+                    post_id,
+                    post_url or "unknown URL",
+                    group_url_for_logging,
                 )
             except Exception as e_gen_id:
                 logging.warning(f"Could not generate fallback post_id: {e_gen_id}")
@@ -306,7 +309,8 @@ def _get_post_identifiers_from_element(
 
     except NoSuchElementException:
         logging.debug(
-            f"Could not find standard post link/identifier elements in group {group_url_for_logging}."
+            "Could not find standard post link/identifier elements in group %s.",
+            group_url_for_logging,
         )
         is_valid_post_candidate = False
     except Exception as e:
@@ -355,7 +359,7 @@ def _extract_data_from_post_html(
                     post_data["post_author_profile_pic_url"] = author_pic_el["src"]
         except Exception as e:
             logging.debug(
-                f"BS: Could not extract author profile picture for post {post_id_from_main}: {e}"
+                "BS: Could not extract author profile picture for post %s: %s", post_id_from_main, e
             )
 
     if scrape_all_fields or "post_author_name" in fields_to_scrape:
@@ -364,7 +368,7 @@ def _extract_data_from_post_html(
             if author_name_el:
                 post_data["post_author_name"] = author_name_el.get_text(strip=True)
         except Exception as e:
-            logging.debug(f"BS: Could not extract author name for post {post_id_from_main}: {e}")
+            logging.debug("BS: Could not extract author name for post %s: %s", post_id_from_main, e)
 
     if scrape_all_fields or "content_text" in fields_to_scrape:
         try:
@@ -408,7 +412,7 @@ def _extract_data_from_post_html(
                     if match:
                         post_data["post_image_url"] = match.group(1)
         except Exception as e:
-            logging.debug(f"BS: Could not extract post image for {post_id_from_main}: {e}")
+            logging.debug("BS: Could not extract post image for %s: %s", post_id_from_main, e)
 
     if scrape_all_fields or "posted_at" in fields_to_scrape:
         try:
@@ -417,7 +421,9 @@ def _extract_data_from_post_html(
             if abbr_el and abbr_el.get("title"):
                 raw_timestamp = abbr_el.get("title")
                 logging.debug(
-                    f"BS: Timestamp from abbr[@title]: {raw_timestamp} for post {post_id_from_main}"
+                    "BS: Timestamp from abbr[@title]: %s for post %s",
+                    raw_timestamp,
+                    post_id_from_main,
                 )
 
             if not raw_timestamp:
@@ -425,7 +431,9 @@ def _extract_data_from_post_html(
                 if time_link_el:
                     raw_timestamp = time_link_el.get_text(strip=True)
                     logging.debug(
-                        f"BS: Timestamp from specific link text: {raw_timestamp} for post {post_id_from_main}"
+                        "BS: Timestamp from specific link text: %s for post %s",
+                        raw_timestamp,
+                        post_id_from_main,
                     )
 
             if not raw_timestamp:
@@ -438,7 +446,9 @@ def _extract_data_from_post_html(
                         if dateparser.parse(link_title, settings={"STRICT_PARSING": False}):
                             raw_timestamp = link_title
                             logging.debug(
-                                f"BS: Timestamp from potential link title: {raw_timestamp} for post {post_id_from_main}"
+                                "BS: Timestamp from potential link title: %s for post %s",
+                                raw_timestamp,
+                                post_id_from_main,
                             )
                             break
 
@@ -450,7 +460,9 @@ def _extract_data_from_post_html(
                         if dateparser.parse(link_aria_label, settings={"STRICT_PARSING": False}):
                             raw_timestamp = link_aria_label
                             logging.debug(
-                                f"BS: Timestamp from potential link aria-label: {raw_timestamp} for post {post_id_from_main}"
+                                "BS: Timestamp from potential link aria-label: %s for post %s",
+                                raw_timestamp,
+                                post_id_from_main,
                             )
                             break
 
@@ -470,12 +482,14 @@ def _extract_data_from_post_html(
                         if dateparser.parse(link_text, settings={"STRICT_PARSING": False}):
                             raw_timestamp = link_text
                             logging.debug(
-                                f"BS: Timestamp from potential link text: {raw_timestamp} for post {post_id_from_main}"
+                                "BS: Timestamp from potential link text: %s for post %s",
+                                raw_timestamp,
+                                post_id_from_main,
                             )
                             break
                 if not raw_timestamp:
                     logging.debug(
-                        f"BS: All timestamp extraction methods failed for post {post_id_from_main}"
+                        "BS: All timestamp extraction methods failed for post %s", post_id_from_main
                     )
 
             if raw_timestamp:
@@ -483,7 +497,10 @@ def _extract_data_from_post_html(
                 if parsed_dt:
                     post_data["posted_at"] = parsed_dt.isoformat()
                     logging.debug(
-                        f"BS: Successfully parsed timestamp '{raw_timestamp}' to '{post_data['posted_at']}' for post {post_id_from_main}"
+                        "BS: Successfully parsed timestamp '%s' to '%s' for post %s",
+                        raw_timestamp,
+                        post_data["posted_at"],
+                        post_id_from_main,
                     )
                 else:
                     logging.warning(
@@ -492,7 +509,7 @@ def _extract_data_from_post_html(
                     post_data["posted_at"] = None
             else:
                 logging.debug(
-                    f"BS: Could not extract any raw timestamp string for post {post_id_from_main}"
+                    "BS: Could not extract any raw timestamp string for post %s", post_id_from_main
                 )
                 post_data["posted_at"] = None
         except Exception as e:
@@ -589,7 +606,9 @@ def _extract_data_from_post_html(
                 ):
                     post_data["comments"].append(comment_details)
             logging.debug(
-                f"BS: Extracted {len(post_data['comments'])} comments for post {post_id_from_main}"
+                "BS: Extracted %s comments for post %s",
+                len(post_data["comments"]),
+                post_id_from_main,
             )
         except Exception as e:
             logging.warning(f"BS: Error extracting comments for post {post_id_from_main}: {e}")
@@ -602,7 +621,8 @@ def _extract_data_from_post_html(
         return post_data
     else:
         logging.debug(
-            f"BS: Skipping post {post_id_from_main} due to missing essential data (URL/ID, Text, Time, Author)."
+            "BS: Skipping post %s due to missing essential data (URL/ID, Text, Time, Author).",
+            post_id_from_main,
         )
         return None
 
@@ -628,7 +648,7 @@ def scrape_authenticated_group(
     logging.info(f"Navigating to group: {group_url}")
     try:
         driver.get(group_url)
-        logging.debug(f"Successfully navigated to {group_url}")
+        logging.debug("Successfully navigated to %s", group_url)
 
         # Wait for feed element and at least one post
         WebDriverWait(driver, 30).until(EC.presence_of_element_located(FEED_OR_SCROLLER_S))
@@ -677,7 +697,7 @@ def scrape_authenticated_group(
                 # Rate limiting with random jitter to avoid detection
                 scroll_delay = random.uniform(1.5, 3.5)
                 logging.debug(
-                    f"Scroll {scroll_attempt}: Waiting {scroll_delay:.2f}s before next action"
+                    "Scroll %s: Waiting %.2fs before next action", scroll_attempt, scroll_delay
                 )
                 time.sleep(scroll_delay)
 
@@ -694,7 +714,9 @@ def scrape_authenticated_group(
                 except TimeoutException:
                     consecutive_no_new_posts += 1
                     logging.debug(
-                        f"Scroll attempt {scroll_attempt}: No new posts detected. Consecutive misses: {consecutive_no_new_posts}"
+                        "Scroll attempt %s: No new posts detected. Consecutive misses: %s",
+                        scroll_attempt,
+                        consecutive_no_new_posts,
                     )
                 except Exception as e:
                     logging.warning(
@@ -735,7 +757,8 @@ def scrape_authenticated_group(
                         for overlay_candidate in potential_overlays:
                             if overlay_candidate.is_displayed():
                                 logging.debug(
-                                    f"Visible overlay detected with selector: {overlay_selector_xpath}. Attempting to dismiss."
+                                    "Visible overlay detected with selector: %s. Attempting to dismiss.",
+                                    overlay_selector_xpath,
                                 )
                                 dismissed_this_one = False
                                 for btn_xpath in dismiss_button_xpaths:
@@ -751,19 +774,24 @@ def scrape_authenticated_group(
                                                 "arguments[0].click();", dismiss_button
                                             )
                                             logging.debug(
-                                                f"Clicked dismiss button ('{btn_xpath}') in overlay {overlay_selector_xpath}."
+                                                "Clicked dismiss button ('%s') in overlay %s.",
+                                                btn_xpath,
+                                                overlay_selector_xpath,
                                             )
                                             WebDriverWait(driver, 5).until(
                                                 EC.invisibility_of_element(overlay_candidate)
                                             )
                                             logging.debug(
-                                                f"Overlay {overlay_selector_xpath} confirmed dismissed."
+                                                "Overlay %s confirmed dismissed.",
+                                                overlay_selector_xpath,
                                             )
                                             dismissed_this_one = True
                                             break
                                     except (TimeoutException, NoSuchElementException):
                                         logging.debug(
-                                            f"Dismiss button '{btn_xpath}' not found or not clickable in overlay {overlay_selector_xpath}."
+                                            "Dismiss button '%s' not found or not clickable in overlay %s.",
+                                            btn_xpath,
+                                            overlay_selector_xpath,
                                         )
                                     except StaleElementReferenceException:
                                         logging.info(
@@ -780,7 +808,9 @@ def scrape_authenticated_group(
 
                     except Exception as e_overlay_check:
                         logging.debug(
-                            f"Error checking/processing overlay selector {overlay_selector_xpath}: {e_overlay_check}"
+                            "Error checking/processing overlay selector %s: %s",
+                            overlay_selector_xpath,
+                            e_overlay_check,
                         )
 
                 current_post_elements = driver.find_elements(
@@ -794,7 +824,9 @@ def scrape_authenticated_group(
                 else:
                     consecutive_no_new_posts += 1
                     logging.debug(
-                        f"No new posts on scroll {scroll_attempt}. Consecutive misses: {consecutive_no_new_posts}"
+                        "No new posts on scroll %s. Consecutive misses: %s",
+                        scroll_attempt,
+                        consecutive_no_new_posts,
                     )
 
                 last_on_page_post_count = len(current_post_elements)
@@ -843,11 +875,12 @@ def scrape_authenticated_group(
                         see_more_button.click()
                         time.sleep(0.5)
                         logging.debug(
-                            f"Clicked 'See more' for post {temp_post_id or temp_post_url}"
+                            "Clicked 'See more' for post %s", temp_post_id or temp_post_url
                         )
                     except (TimeoutException, NoSuchElementException):
                         logging.debug(
-                            f"No 'See more' button or not clickable for post {temp_post_id or temp_post_url}"
+                            "No 'See more' button or not clickable for post %s",
+                            temp_post_id or temp_post_url,
                         )
                     except Exception as e_sm:
                         logging.warning(
@@ -888,7 +921,10 @@ def scrape_authenticated_group(
                             yield result
                             extracted_count += 1
                             logging.debug(
-                                f"Yielded post {extracted_count}/{num_posts} (ID: {result.get('facebook_post_id')}) by worker."
+                                "Yielded post %s/%s (ID: %s) by worker.",
+                                extracted_count,
+                                num_posts,
+                                result.get("facebook_post_id"),
                             )
                     except concurrent.futures.TimeoutError:
                         logging.warning(
@@ -916,7 +952,10 @@ def scrape_authenticated_group(
                         yield result
                         extracted_count += 1
                         logging.debug(
-                            f"Yielded post {extracted_count}/{num_posts} (ID: {result.get('facebook_post_id')}) during final collection."
+                            "Yielded post %s/%s (ID: %s) during final collection.",
+                            extracted_count,
+                            num_posts,
+                            result.get("facebook_post_id"),
                         )
                 except Exception as e_final_future:
                     logging.error(
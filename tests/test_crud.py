@@ -0,0 +1,227 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import orjson
+
+from database.crud import (
+    add_comments_for_post,
+    add_group,
+    add_scraped_post,
+    close_pooled_connections,
+    get_all_categorized_posts,
+    get_comments_for_post,
+    get_db_connection,
+    get_unprocessed_posts,
+    has_unprocessed_items,
+    release_db_connection,
+    update_comments_with_ai_results_bulk,
+    update_posts_with_ai_results_bulk,
+    upsert_group,
+)
+from database.db_setup import init_db
+
+
+class TestCrud(unittest.TestCase):
+    def setUp(self):
+        """Create a fresh database file for each test"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "test_insights.db")
+        init_db(self.db_path)
+        self.conn = get_db_connection(self.db_path)
+        self.group_id = add_group(self.conn, "Test Group", "https://facebook.com/groups/test")
+        self.post_id = add_scraped_post(
+            self.conn,
+            {
+                "facebook_post_id": "fb_1",
+                "post_url": "https://facebook.com/groups/test/posts/1",
+                "content_text": "Test post content",
+                "posted_at": "2024-01-01 10:00:00",
+                "post_author_name": "Test Author",
+            },
+            self.group_id,
+        )
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_add_comments_for_post(self):
+        """Test that a batch of comments is inserted and duplicates are ignored"""
+        comments = [
+            {
+                "commenterName": f"Commenter {i}",
+                "commentText": f"Comment {i}",
+                "commentFacebookId": f"comment_{i}",
+            }
+            for i in range(3)
+        ]
+        self.assertTrue(add_comments_for_post(self.conn, self.post_id, comments))
+        self.assertTrue(add_comments_for_post(self.conn, self.post_id, comments[:1]))
+
+        stored = get_comments_for_post(self.conn, self.post_id)
+        self.assertEqual(len(stored), 3)
+        self.assertEqual(len({c["comment_scraped_at"] for c in stored}), 1)
+        self.assertFalse(self.conn.in_transaction)
+
+    def test_duplicate_post_returns_existing_id_without_writing(self):
+        """Test that re-adding a known post URL returns its ID and leaves the row untouched"""
+        changes = self.conn.total_changes
+        post = {"post_url": "https://facebook.com/groups/test/posts/1", "content_text": "Again"}
+
+        self.assertEqual(add_scraped_post(self.conn, post, self.group_id), self.post_id)
+        self.assertEqual(self.conn.total_changes, changes)
+        self.assertIsNone(add_scraped_post(self.conn, post, self.group_id + 1))
+
+    def test_update_posts_with_ai_results_bulk(self):
+        """Test that bulk AI updates mark every post as processed in one call"""
+        ai_data = {"ai_category": "Project Idea", "ai_is_potential_idea": True}
+        updated = update_posts_with_ai_results_bulk(
+            self.conn, [(self.post_id, ai_data), (self.post_id + 1000, ai_data)]
+        )
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(get_unprocessed_posts(self.conn, self.group_id), [])
+
+    def test_has_unprocessed_items(self):
+        """Test that pending work is detected per group and cleared once processed"""
+        self.assertTrue(has_unprocessed_items(self.conn, self.group_id))
+        self.assertFalse(has_unprocessed_items(self.conn, self.group_id + 1))
+
+        update_posts_with_ai_results_bulk(self.conn, [(self.post_id, {"ai_category": "Idea"})])
+        self.assertFalse(has_unprocessed_items(self.conn))
+
+    def test_writes_without_commit_join_callers_transaction(self):
+        """Test that commit=False leaves the post and its comments uncommitted"""
+        post_id = add_scraped_post(
+            self.conn,
+            {"post_url": "https://facebook.com/groups/test/posts/2", "content_text": "Second"},
+            self.group_id,
+            commit=False,
+        )
+        add_comments_for_post(
+            self.conn, post_id, [{"commentText": "Hi", "commentFacebookId": "c_2"}], commit=False
+        )
+        self.assertTrue(self.conn.in_transaction)
+
+        self.conn.rollback()
+        self.assertEqual(get_comments_for_post(self.conn, post_id), [])
+        self.assertEqual(len(get_unprocessed_posts(self.conn, self.group_id)), 1)
+
+    def test_get_all_categorized_posts_leaves_filters_unchanged(self):
+        """Test that the limit is applied without being removed from the caller's filters"""
+        update_posts_with_ai_results_bulk(self.conn, [(self.post_id, {"ai_category": "Idea"})])
+        filters = {"category": "Idea", "limit": 1}
+
+        posts = get_all_categorized_posts(self.conn, None, filters)
+
+        self.assertEqual([post["internal_post_id"] for post in posts], [self.post_id])
+        self.assertEqual(filters, {"category": "Idea", "limit": 1})
+
+    def test_menu_filters_narrow_categorized_posts(self):
+        """Test that column-named filters from the view menu are applied as exact matches"""
+        other_id = add_scraped_post(
+            self.conn,
+            {
+                "post_url": "https://facebook.com/groups/test/posts/2",
+                "content_text": "Other",
+                "post_author_name": "Other Author",
+            },
+            self.group_id,
+        )
+        update_posts_with_ai_results_bulk(
+            self.conn,
+            [
+                (self.post_id, {"ai_category": "Idea", "ai_is_potential_idea": 1}),
+                (other_id, {"ai_category": "Question"}),
+            ],
+        )
+
+        def post_ids(filters):
+            return [
+                post["internal_post_id"]
+                for post in get_all_categorized_posts(self.conn, None, filters)
+            ]
+
+        self.assertEqual(post_ids({"ai_category": "Idea"}), [self.post_id])
+        self.assertEqual(post_ids({"post_author_name": "Other Author"}), [other_id])
+        self.assertEqual(post_ids({"ai_is_potential_idea": "1"}), [self.post_id])
+
+    def test_menu_author_filter_uses_author_index(self):
+        """Test that the view menu's exact author filter is served by idx_posts_author"""
+        statements = []
+        self.conn.set_trace_callback(statements.append)
+        get_all_categorized_posts(self.conn, None, {"post_author_name": "Test Author"})
+        self.conn.set_trace_callback(None)
+        query = next(sql for sql in statements if "FROM Posts" in sql)
+
+        plan = " ".join(row[3] for row in self.conn.execute(f"EXPLAIN QUERY PLAN {query}"))
+
+        self.assertIn("idx_posts_author", plan)
+
+    def test_keywords_are_read_back_as_a_list(self):
+        """Test that keywords given as JSON text, as providers send them, come back as a list"""
+        update_posts_with_ai_results_bulk(
+            self.conn,
+            [(self.post_id, {"ai_category": "Idea", "ai_keywords": '["app", "saas"]'})],
+        )
+
+        (post,) = get_all_categorized_posts(self.conn, None, {})
+
+        self.assertEqual(post["ai_keywords"], ["app", "saas"])
+
+    def test_comment_keywords_are_stored_as_a_list(self):
+        """Test that comment keywords given as JSON text are stored encoded once, like posts"""
+        add_comments_for_post(
+            self.conn, self.post_id, [{"commentText": "Hi", "commentFacebookId": "c_1"}]
+        )
+        (comment,) = get_comments_for_post(self.conn, self.post_id)
+        update_comments_with_ai_results_bulk(
+            self.conn, [(comment["comment_id"], {"ai_comment_keywords": '["app", "saas"]'})]
+        )
+
+        (comment,) = get_comments_for_post(self.conn, self.post_id)
+
+        self.assertEqual(orjson.loads(comment["ai_comment_keywords"]), ["app", "saas"])
+
+    def test_upsert_group_returns_existing_or_new_id(self):
+        """Test that upserting a known URL returns its group and a new URL creates one"""
+        changes = self.conn.total_changes
+        existing = upsert_group(self.conn, "Other Name", "https://facebook.com/groups/test")
+        self.assertEqual(self.conn.total_changes, changes)
+        created = upsert_group(self.conn, "New Group", "https://facebook.com/groups/new")
+
+        self.assertEqual(existing, self.group_id)
+        self.assertNotIn(created, (None, self.group_id))
+        self.assertEqual(
+            upsert_group(self.conn, "New Group", "https://facebook.com/groups/new"), created
+        )
+
+    def test_released_connection_is_reused(self):
+        """Test that a released connection is handed out again with no open transaction"""
+        conn = get_db_connection(self.db_path)
+        conn.execute("BEGIN")
+        release_db_connection(conn)
+
+        reused = get_db_connection(self.db_path)
+        self.assertIs(reused, conn)
+        self.assertFalse(reused.in_transaction)
+        reused.close()
+
+    def test_close_pooled_connections(self):
+        """Test that idle pooled connections are closed and not handed out again"""
+        conn = get_db_connection(self.db_path)
+        release_db_connection(conn)
+
+        close_pooled_connections()
+
+        fresh = get_db_connection(self.db_path)
+        self.assertIsNot(fresh, conn)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        fresh.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import csv
+import importlib.util
+import os
+import tempfile
+import unittest
+
+import orjson
+
+from database.crud import (
+    add_comments_for_post,
+    add_group,
+    add_scraped_post,
+    get_db_connection,
+    update_posts_with_ai_results_bulk,
+)
+from database.db_setup import init_db
+from export.exporter import (
+    export_to_csv,
+    export_to_json,
+    export_to_parquet,
+    fetch_data_for_export,
+    get_output_paths,
+)
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestExporter(unittest.TestCase):
+    def setUp(self):
+        """Create a database with one group, two categorized posts and their comments"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmp_dir.name, "test_insights.db")
+        init_db(db_path)
+        self.conn = get_db_connection(db_path)
+        group_id = add_group(self.conn, "Test Group", "https://facebook.com/groups/test")
+
+        updates = []
+        for i, raw_response in enumerate([{"category": "Idea"}, ["not", "a", "dict"]]):
+            post_id = add_scraped_post(
+                self.conn,
+                {
+                    "post_url": f"https://facebook.com/groups/test/posts/{i}",
+                    "content_text": f'Post, with "quotes"\n{i}',
+                    "posted_at": f"2024-01-0{i + 1} 10:00:00",
+                    "post_author_name": "Test Author",
+                },
+                group_id,
+            )
+            add_comments_for_post(
+                self.conn,
+                post_id,
+                [{"commentText": f"Comment {i}", "commentFacebookId": f"c_{i}"}],
+            )
+            updates.append(
+                (
+                    post_id,
+                    {
+                        "ai_category": "Idea",
+                        "ai_keywords": ["app", "saas"],
+                        "ai_raw_response": raw_response,
+                    },
+                )
+            )
+        update_posts_with_ai_results_bulk(self.conn, updates)
+        self.output = os.path.join(self.tmp_dir.name, "out", "export")
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_csv_export_writes_table_and_combined_files(self):
+        """Test that CSV export writes every table plus a combined file in one pass"""
+        exported = export_to_csv(fetch_data_for_export(self.conn, {}, "all"), self.output)
+
+        self.assertEqual(exported, {"groups": 1, "posts": 2, "comments": 2, "combined": 5})
+        paths = get_output_paths(self.output, "csv")
+        with open(paths["posts"], newline="", encoding="utf-8") as f:
+            posts = list(csv.DictReader(f))
+        self.assertEqual(posts[0]["post_content_raw"], 'Post, with "quotes"\n1')
+        with open(paths["combined"], newline="", encoding="utf-8") as f:
+            record_types = [row["record_type"] for row in csv.DictReader(f)]
+        self.assertEqual(record_types, ["group", "post", "post", "comment", "comment"])
+
+    def test_single_entity_export_writes_combined_file(self):
+        """Test that a posts-only export still writes its combined file"""
+        exported = export_to_json(fetch_data_for_export(self.conn, {}, "posts"), self.output)
+
+        self.assertEqual(exported, {"groups": 0, "posts": 2, "comments": 0, "combined": 2})
+        paths = get_output_paths(self.output, "json")
+        with open(paths["combined"], "rb") as f:
+            combined = orjson.loads(f.read())
+        self.assertEqual([record["record_type"] for record in combined], ["post", "post"])
+        self.assertFalse(os.path.exists(paths["comments"]))
+
+    def test_json_export_round_trips_posts(self):
+        """Test that JSON export decodes keywords and raw responses into plain JSON values"""
+        export_to_json(fetch_data_for_export(self.conn, {}, "posts"), self.output, pretty=True)
+
+        with open(get_output_paths(self.output, "json")["posts"], "rb") as f:
+            posts = orjson.loads(f.read())
+        self.assertEqual([post["ai_keywords"] for post in posts], [["app", "saas"]] * 2)
+        self.assertEqual(
+            [post["ai_raw_response"] for post in posts],
+            [["not", "a", "dict"], {"category": "Idea"}],
+        )
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet_export_handles_mixed_raw_responses(self):
+        """Test that raw responses of different JSON types are stored as JSON text"""
+        import pyarrow.parquet as pq
+
+        exported = export_to_parquet(fetch_data_for_export(self.conn, {}, "all"), self.output)
+
+        self.assertEqual(exported["posts"], 2)
+        table = pq.read_table(get_output_paths(self.output, "parquet")["posts"])
+        self.assertEqual(
+            table.column("ai_raw_response").to_pylist(),
+            ['["not","a","dict"]', '{"category":"Idea"}'],
+        )
+        self.assertEqual(table.column("ai_keywords").to_pylist(), [["app", "saas"]] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
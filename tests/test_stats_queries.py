@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from database.crud import (
+    add_comments_for_post,
+    add_group,
+    add_scraped_post,
+    get_db_connection,
+    remove_group,
+    update_post_with_ai_results,
+)
+from database.db_setup import init_db
+from database.stats_queries import get_all_statistics
+
+
+class TestStatsQueries(unittest.TestCase):
+    def setUp(self):
+        """Create a fresh database file for each test"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "test_insights.db")
+        init_db(self.db_path)
+        self.conn = get_db_connection(self.db_path)
+        self.group_id = add_group(self.conn, "Test Group", "https://facebook.com/groups/test")
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def _add_post(self, number: int) -> int:
+        return add_scraped_post(
+            self.conn,
+            {"post_url": f"https://facebook.com/groups/test/posts/{number}", "content_text": "x"},
+            self.group_id,
+        )
+
+    def test_counters_follow_inserts_updates_and_deletes(self):
+        """Test that the trigger-maintained counters match the table contents"""
+        first = self._add_post(1)
+        self._add_post(2)
+        self._add_post(2)  # duplicate, ignored
+        add_comments_for_post(
+            self.conn,
+            first,
+            [
+                {"commentText": "a", "commentFacebookId": "c1"},
+                {"commentText": "b", "commentFacebookId": "c2"},
+            ],
+        )
+        update_post_with_ai_results(self.conn, first, {"ai_category": "Idea"})
+
+        stats = get_all_statistics(self.conn)
+        self.assertEqual(stats["total_posts"], 2)
+        self.assertEqual(stats["unprocessed_posts"], 1)
+        self.assertEqual(stats["total_comments"], 2)
+        self.assertEqual(stats["avg_comments_per_post"], 2.0)
+
+        self.conn.execute("DELETE FROM Comments")
+        self.conn.execute("DELETE FROM Posts")
+        self.conn.commit()
+        remove_group(self.conn, self.group_id)
+
+        stats = get_all_statistics(self.conn)
+        self.assertEqual(stats["total_posts"], 0)
+        self.assertEqual(stats["unprocessed_posts"], 0)
+        self.assertEqual(stats["total_comments"], 0)
+
+    def test_counters_seeded_from_existing_rows(self):
+        """Test that a database created before the counters existed is seeded on init"""
+        self._add_post(1)
+        self.conn.execute("DROP TABLE Counters")
+        self.conn.execute("PRAGMA user_version = 0")
+        self.conn.commit()
+
+        init_db(self.db_path)
+
+        stats = get_all_statistics(self.conn)
+        self.assertEqual(stats["total_posts"], 1)
+        self.assertEqual(stats["unprocessed_posts"], 1)
+
+    def test_init_db_is_repeatable(self):
+        """Test that initializing an existing database leaves the counters alone"""
+        self._add_post(1)
+
+        with self.assertNoLogs(level="ERROR"):
+            init_db(self.db_path)
+
+        self.assertEqual(get_all_statistics(self.conn)["total_posts"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()